@@ -25,7 +25,7 @@ from services.billing import create_billing_routes
 from services.dev_tools import create_dev_routes
 from services.analytics import create_analytics_routes
 from services.reports import create_reports_routes
-from services.config import initialize_sentry, initialize_stripe, initialize_openai, setup_compression
+from services.config import initialize_sentry, initialize_stripe, initialize_openai, setup_compression, setup_json
 from utils.metrics import list_metrics, list_timings
 from utils.parse import extract_display_md
 from utils.prompts import load_text_prompt
@@ -57,6 +57,7 @@ app.config["SESSION_COOKIE_SAMESITE"] = "Lax"
 
 # Setup optional middleware
 setup_compression(app)
+setup_json(app)
 
 @app.after_request
 def add_security_headers(response):
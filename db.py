@@ -3,12 +3,18 @@
 import json
 import os
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from psycopg.errors import UniqueViolation
+from psycopg.types.json import Jsonb, set_json_dumps
 from psycopg_pool import ConnectionPool
 
-from utils.normalize import normalize_name
+from utils.fast_json import json_dumps
+from utils.normalize import consonant_sig, normalize_name
+
+# Serialize Jsonb-wrapped params with the orjson-backed dumper so dict
+# payloads are encoded exactly once, on the driver's fast path.
+set_json_dumps(json_dumps)
 
 # Prompt version tag to distinguish cached reports across prompt iterations.
 # Increment this when changing the scouting prompt meaningfully.
@@ -38,16 +44,18 @@ def _get_pool() -> ConnectionPool:
         
         _pool = ConnectionPool(
             dsn,
-            min_size=2,
-            max_size=20,  # Increased from 10 to handle concurrent onboarding
+            min_size=4,  # keep warm connections so request bursts skip TCP/SCRAM setup
+            max_size=25,  # Increased from 20 to handle concurrent onboarding
             timeout=10,
             max_lifetime=180,
-            max_idle=60,
+            max_idle=300,
             reconnect_timeout=15,
             kwargs={
                 "options": "-c statement_timeout=30s",
-                # Disable prepared statement caching to avoid conflicts with dynamic SQL
-                "prepare_threshold": None,
+                # Auto-PREPARE statements after a few identical executions so
+                # the hot SELECTs skip re-parse/re-plan; one-off dynamic SQL
+                # never crosses the threshold and stays unprepared.
+                "prepare_threshold": 3,
             },
         )
     return _pool
@@ -75,6 +83,11 @@ def norm(s: str | None) -> str:
     return normalize_name(s or "", transliterate=True)
 
 
+def sig(s: str | None) -> str:
+    """Consonant signature for indexed name-bucket lookups"""
+    return consonant_sig(s or "")
+
+
 def _canonical_query_key(query_obj: Dict[str, Any]) -> str:
     # Deterministic representation: same object => same key
     # IMPORTANT: keep spaces so it matches Postgres jsonb::text formatting
@@ -349,7 +362,7 @@ def upsert_report(
     """
     query_key = _canonical_query_key(query_obj)
     q_text = query_key
-    p_text = json.dumps(payload or {}, ensure_ascii=False, default=str)
+    p_payload = Jsonb(payload or {})
     
     # Split report_md into narrative and stats
     import re
@@ -365,10 +378,12 @@ def upsert_report(
     with _get_pool().connection() as conn, conn.cursor() as cur:
         cur.execute(
             """
-            insert into public.reports (user_id, player_name, query, query_key, report_md, report_narrative_md, stats_md, payload, cached, report_generated_at, stats_updated_at)
-            values (%s, %s, %s, %s, %s, %s, %s, %s::jsonb, %s, now(), now())
+            insert into public.reports (user_id, player_name, player_name_norm, player_name_sig, query, query_key, report_md, report_narrative_md, stats_md, payload, cached, report_generated_at, stats_updated_at)
+            values (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, now(), now())
             on conflict (user_id, query_key) do update
               set player_name = excluded.player_name,
+                  player_name_norm = excluded.player_name_norm,
+                  player_name_sig = excluded.player_name_sig,
                   query       = excluded.query,
                   report_md   = excluded.report_md,
                   report_narrative_md = excluded.report_narrative_md,
@@ -379,14 +394,179 @@ def upsert_report(
                   report_generated_at = now(),
                   stats_updated_at = now()
             returning id
-            """, 
-            (user_id, player_name, q_text, query_key, report_md, narrative_md, stats_md, p_text, bool(cached)),
+            """,
+            (user_id, player_name, norm(player_name), sig(player_name), q_text, query_key, report_md, narrative_md, stats_md, p_payload, bool(cached)),
         )
         (rid,) = cur.fetchone()
         conn.commit()
         return int(rid)
 
 
+def spend_credit_and_insert_report(
+    user_id: str,
+    amount: int,
+    *,
+    reason: str,
+    source_type: str,
+    source_id: str,
+    player_name: str,
+    query_obj: Dict[str, Any],
+    report_md: str,
+    payload: Dict[str, Any],
+    cached: bool,
+) -> Dict[str, Any]:
+    """
+    Spend credits and upsert the report in ONE transaction.
+
+    The ledger row and the report commit (or roll back) together, so the
+    caller needs no compensating refund when the insert fails. Per-user
+    serialization via an advisory xact lock keeps concurrent requests from
+    double-charging.
+
+    Returns: {"id": int, "created_at": iso str or None, "balance": int}
+    Raises: ValueError("INSUFFICIENT_CREDITS") when not enough balance.
+    """
+    if amount <= 0:
+        raise ValueError("amount must be > 0")
+    if not source_type or not source_id:
+        raise ValueError("source_type and source_id are required")
+
+    query_key = _canonical_query_key(query_obj)
+    p_payload = Jsonb(payload or {})
+
+    # Split report_md into narrative and stats
+    import re
+    stats_pattern = r'### Season snapshot'
+    match = re.search(stats_pattern, report_md or "")
+    if match:
+        narrative_md = report_md[:match.start()]
+        stats_md = report_md[match.start():]
+    else:
+        narrative_md = report_md or ""
+        stats_md = ""
+
+    with _get_pool().connection() as conn, conn.cursor() as cur:
+        cur.execute("select pg_advisory_xact_lock(hashtext('user:' || %s))", (user_id,))
+        _ensure_user_row(cur, user_id)
+
+        cur.execute(
+            """
+            update public.user_credits
+               set balance = balance - %s,
+                   updated_at = now()
+             where user_id = %s
+               and balance >= %s
+         returning balance
+            """,
+            (amount, user_id, amount),
+        )
+        row = cur.fetchone()
+        if not row:
+            conn.rollback()
+            raise ValueError("INSUFFICIENT_CREDITS")
+        new_balance = int(row[0])
+
+        cur.execute(
+            """
+            insert into public.credit_ledger(user_id, delta, reason, source_type, source_id)
+            values (%s, %s, %s, %s, %s)
+            on conflict (source_type, source_id) do nothing
+            returning 1
+            """,
+            (user_id, -amount, reason, source_type, source_id),
+        )
+        if not cur.fetchone():
+            # Already charged for this source_id: drop the duplicate
+            # decrement and continue with just the report upsert.
+            conn.rollback()
+            cur.execute("select pg_advisory_xact_lock(hashtext('user:' || %s))", (user_id,))
+            cur.execute(
+                "select balance from public.user_credits where user_id = %s", (user_id,)
+            )
+            row2 = cur.fetchone()
+            new_balance = int(row2[0]) if row2 else 0
+
+        cur.execute(
+            """
+            insert into public.reports (user_id, player_name, player_name_norm, player_name_sig, query, query_key, report_md, report_narrative_md, stats_md, payload, cached, report_generated_at, stats_updated_at)
+            values (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, now(), now())
+            on conflict (user_id, query_key) do update
+              set player_name = excluded.player_name,
+                  player_name_norm = excluded.player_name_norm,
+                  player_name_sig = excluded.player_name_sig,
+                  query       = excluded.query,
+                  report_md   = excluded.report_md,
+                  report_narrative_md = excluded.report_narrative_md,
+                  stats_md    = excluded.stats_md,
+                  payload     = excluded.payload,
+                  cached      = excluded.cached,
+                  updated_at  = now(),
+                  report_generated_at = now(),
+                  stats_updated_at = now()
+            returning id, created_at
+            """,
+            (user_id, player_name, norm(player_name), sig(player_name), query_key, query_key, report_md, narrative_md, stats_md, p_payload, bool(cached)),
+        )
+        rid, created_at = cur.fetchone()
+        conn.commit()
+        return {
+            "id": int(rid),
+            "created_at": created_at.isoformat() if created_at else None,
+            "balance": new_balance,
+        }
+
+
+def touch_or_insert_report(
+    user_id: str,
+    player_name: str,
+    query_obj: Dict[str, Any],
+    report_md: str,
+    payload: Dict[str, Any],
+    cached: bool,
+) -> Dict[str, Any]:
+    """
+    Insert the report, or — when the user already has a row for this
+    query_key — just bump its updated_at without clobbering the content.
+    Collapses the find-then-insert-then-refetch pattern into one round-trip.
+    Requires the unique index on (user_id, query_key).
+
+    Returns: {"id": int, "created_at": iso str or None, "inserted": bool}
+    """
+    query_key = _canonical_query_key(query_obj)
+    q_text = query_key
+    p_payload = Jsonb(payload or {})
+
+    # Split report_md into narrative and stats
+    import re
+    stats_pattern = r'### Season snapshot'
+    match = re.search(stats_pattern, report_md or "")
+    if match:
+        narrative_md = report_md[:match.start()]
+        stats_md = report_md[match.start():]
+    else:
+        narrative_md = report_md or ""
+        stats_md = ""
+
+    with _get_pool().connection() as conn, conn.cursor() as cur:
+        cur.execute(
+            """
+            insert into public.reports (user_id, player_name, player_name_norm, player_name_sig, query, query_key, report_md, report_narrative_md, stats_md, payload, cached, report_generated_at, stats_updated_at)
+            values (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, now(), now())
+            on conflict (user_id, query_key) do update
+              set updated_at = now()
+            returning id, created_at, (xmax = 0) as inserted
+            """,
+            (user_id, player_name, norm(player_name), sig(player_name), q_text, query_key, report_md, narrative_md, stats_md, p_payload, bool(cached)),
+        )
+        rid, created_at, inserted = cur.fetchone()
+        conn.commit()
+        return {
+            "id": int(rid),
+            "created_at": created_at.isoformat() if created_at else None,
+            "inserted": bool(inserted),
+        }
+
+
 def update_report_by_id(
     user_id: str,
     report_id: int,
@@ -396,14 +576,15 @@ def update_report_by_id(
     cached: bool,
     update_generated_at: bool = True,
     update_stats_updated_at: bool = True,
-) -> int:
+) -> Tuple[int, datetime]:
     """
     Updates an existing report by ID (for regenerations and stats refresh).
     Splits report_md into narrative_md and stats_md.
     Ensures the report belongs to the user before updating.
+    Returns (id, created_at) so callers don't need a follow-up fetch.
     """
-    p_text = json.dumps(payload or {}, ensure_ascii=False, default=str)
-    
+    p_payload = Jsonb(payload or {})
+
     # Split report_md into narrative and stats
     import re
     stats_pattern = r'### Season snapshot'
@@ -420,23 +601,27 @@ def update_report_by_id(
             """
             update public.reports
             set player_name = %s,
+                player_name_norm = %s,
+                player_name_sig = %s,
                 report_md = %s,
                 report_narrative_md = %s,
                 stats_md = %s,
-                payload = %s::jsonb,
+                payload = %s,
                 cached = %s,
                 updated_at = now(),
                 report_generated_at = case when %s then now() else report_generated_at end,
                 stats_updated_at = case when %s then now() else stats_updated_at end
             where id = %s and user_id = %s
-            returning id
+            returning id, created_at
             """,
             (
                 player_name,
+                norm(player_name),
+                sig(player_name),
                 report_md,
                 narrative_md,
                 stats_md,
-                p_text,
+                p_payload,
                 bool(cached),
                 bool(update_generated_at),
                 bool(update_stats_updated_at),
@@ -448,7 +633,7 @@ def update_report_by_id(
         if not row:
             raise ValueError(f"Report {report_id} not found or does not belong to user {user_id}")
         conn.commit()
-        return int(row[0])
+        return int(row[0]), row[1]
 
 
 # Backwards-compatible name (your app.py uses insert_report)
@@ -470,8 +655,38 @@ def insert_report(
     )
 
 
-def list_reports(user_id: str, q: str = "", limit: int = 20, offset: int = 0) -> List[Dict[str, Any]]:
+def insert_report_from_source(source_report_id: int, user_id: str) -> Optional[int]:
+    """
+    Copy an existing report (any owner) into user_id's library server-side.
+
+    One INSERT ... SELECT round-trip; payload/report_md never leave
+    Postgres. The copy keeps the source's query/query_key so a repeat save
+    hits the (user_id, query_key) upsert and stays idempotent. Marks the
+    copy cached=TRUE.
+
+    Returns the new (or touched) row id, or None when the source is missing.
+    """
+    with _get_pool().connection() as conn, conn.cursor() as cur:
+        cur.execute(
+            """
+            insert into public.reports (user_id, player_name, player_name_norm, player_name_sig, query, query_key, report_md, report_narrative_md, stats_md, payload, cached, report_generated_at, stats_updated_at)
+            select %s, player_name, player_name_norm, player_name_sig, query, query_key, report_md, report_narrative_md, stats_md, payload, true, now(), now()
+            from public.reports
+            where id = %s
+            on conflict (user_id, query_key) do update
+              set updated_at = now()
+            returning id
+            """,
+            (user_id, int(source_report_id)),
+        )
+        row = cur.fetchone()
+        conn.commit()
+        return int(row[0]) if row else None
+
+
+def list_reports(user_id: str, q: str = "", limit: int = 20, offset: int = 0, league: str = "") -> List[Dict[str, Any]]:
     q = (q or "").strip()
+    league = (league or "").strip().lower()
     # Allow larger result sets; capped to avoid unbounded queries
     limit = max(1, min(int(limit or 20), 1000))
     offset = max(0, int(offset or 0))
@@ -496,6 +711,15 @@ def list_reports(user_id: str, q: str = "", limit: int = 20, offset: int = 0) ->
         like = f"%{q}%"
         params += [like, like, like, like, like]
 
+    if league:
+        # Exact league filter applied server-side so fuzzy-match scans don't
+        # ship rows Python would reject anyway. Rows with no recorded league
+        # are kept — they can still match on name alone.
+        where += """ and lower(trim(coalesce(
+            nullif(trim(payload->>'league'), ''),
+            payload->'info_fields'->>'League', ''))) in ('', %s)"""
+        params.append(league)
+
     try:
         with _get_pool().connection() as conn, conn.cursor() as cur:
             try:
@@ -561,6 +785,134 @@ def list_reports(user_id: str, q: str = "", limit: int = 20, offset: int = 0) ->
     return results
 
 
+def find_similar_reports_trgm(user_id: str, player_norm: str, limit: int = 10) -> List[Dict[str, Any]]:
+    """
+    Trigram K-NN candidate lookup for fuzzy name matching.
+
+    Uses pg_trgm's % operator against the indexed player_name_norm column
+    so candidate retrieval is one indexed query instead of scanning the
+    user's report window in Python. Requires the pg_trgm extension and
+    GIN index from db_schema.sql; returns [] when either is missing so
+    callers can fall back to the scan path.
+
+    Rows match the list_reports shape plus a 0-100 `score`.
+    """
+    if not player_norm:
+        return []
+    limit = max(1, min(int(limit or 10), 50))
+    try:
+        with _get_pool().connection() as conn, conn.cursor() as cur:
+            try:
+                cur.execute(
+                    """
+                    select id, player_name, created_at, cached,
+                           similarity(player_name_norm, %s) as score,
+                           payload->>'league' as league,
+                           coalesce(payload->>'team', payload->>'team_name') as team,
+                           payload->'info_fields' as info_fields
+                    from public.reports
+                    where user_id = %s and player_name_norm %% %s
+                    order by score desc, created_at desc
+                    limit %s
+                    """,
+                    (player_norm, user_id, player_norm, limit),
+                    prepare=True,
+                )
+                rows = cur.fetchall()
+            except Exception:
+                try:
+                    conn.rollback()
+                except Exception:
+                    pass
+                raise
+    except Exception:
+        return []
+
+    results = []
+    for r in rows:
+        info_fields = r[7] if isinstance(r[7], dict) else {}
+        results.append({
+            "id": int(r[0]),
+            "player_name": r[1],
+            "created_at": r[2].isoformat() if r[2] else None,
+            "cached": bool(r[3]),
+            "score": int(round(float(r[4] or 0) * 100)),
+            "league": (r[5] or info_fields.get("League") or "").strip(),
+            "team": (r[6] or info_fields.get("Team") or "").strip(),
+            "position": (info_fields.get("Position") or "").strip(),
+        })
+    return results
+
+
+def find_report_exact_norm(
+    user_id: str, player_norm: str, league: str = "", limit: int = 5
+) -> List[Dict[str, Any]]:
+    """Indexed lookup of reports whose normalized player name equals `player_norm`.
+
+    One btree probe on idx_reports_player_name_norm replaces scanning the
+    candidate window in Python when the query name matches a saved report
+    exactly. `user_id` of "*" searches all users, like list_reports;
+    `league` applies the same exact server-side filter. Rows come newest
+    first in the list_reports shape (minus position).
+    """
+    player_norm = (player_norm or "").strip()
+    if not player_norm:
+        return []
+    league = (league or "").strip().lower()
+    limit = max(1, min(int(limit or 5), 50))
+
+    where = "player_name_norm = %s"
+    params: List[Any] = [player_norm]
+    if user_id != "*":
+        where += " and user_id = %s"
+        params.append(user_id)
+    if league:
+        where += """ and lower(trim(coalesce(
+            nullif(trim(payload->>'league'), ''),
+            payload->'info_fields'->>'League', ''))) in ('', %s)"""
+        params.append(league)
+
+    try:
+        with _get_pool().connection() as conn, conn.cursor() as cur:
+            try:
+                cur.execute(
+                    f"""
+                    select id, player_name, created_at, cached,
+                           payload->>'league' as league,
+                           coalesce(payload->>'team', payload->>'team_name') as team,
+                           payload->'info_fields' as info_fields
+                    from public.reports
+                    where {where}
+                    order by created_at desc, id desc
+                    limit %s
+                    """,
+                    (*params, limit),
+                    prepare=True,
+                )
+                rows = cur.fetchall()
+            except Exception:
+                try:
+                    conn.rollback()
+                except Exception:
+                    pass
+                raise
+    except Exception:
+        return []
+
+    results = []
+    for r in rows:
+        info_fields = r[6] if isinstance(r[6], dict) else {}
+        results.append({
+            "id": int(r[0]),
+            "player_name": r[1],
+            "created_at": r[2].isoformat() if r[2] else None,
+            "cached": bool(r[3]),
+            "league": (r[4] or info_fields.get("League") or "").strip(),
+            "team": (r[5] or info_fields.get("Team") or "").strip(),
+        })
+    return results
+
+
 def count_reports(user_id: str, q: str = "") -> int:
     """Return total reports matching user/q for pagination and badge counts."""
     q = (q or "").strip()
@@ -714,6 +1066,82 @@ def get_report_by_id(report_id: int) -> Optional[Dict[str, Any]]:
     }
 
 
+def get_reports_by_ids(
+    report_ids: List[int], user_id: Optional[str] = None, league: str = ""
+) -> Dict[int, Dict[str, Any]]:
+    """Fetch several reports in one round trip, keyed by id.
+
+    Serves the embedding-similarity path: the nearest-neighbor ids come
+    back as a ranked list, and fetching their payloads one `get_report`
+    call at a time paid a sequential round trip per candidate. Optional
+    `user_id` scopes like `get_report`; `league` applies the same exact
+    server-side filter as `list_reports` (rows with no recorded league
+    are kept). Missing/filtered ids are simply absent from the result.
+    """
+    ids = [int(r) for r in (report_ids or [])]
+    if not ids:
+        return {}
+    league = (league or "").strip().lower()
+
+    where = "id = any(%s)"
+    params: List[Any] = [ids]
+    if user_id is not None:
+        where += " and user_id = %s"
+        params.append(user_id)
+    if league:
+        where += """ and lower(trim(coalesce(
+            nullif(trim(payload->>'league'), ''),
+            payload->'info_fields'->>'League', ''))) in ('', %s)"""
+        params.append(league)
+
+    with _get_pool().connection() as conn, conn.cursor() as cur:
+        cur.execute(
+            f"""
+            select id, payload, report_md, report_narrative_md, stats_md, player_name, created_at, updated_at, report_generated_at, stats_updated_at, cached
+            from public.reports
+            where {where}
+            """,
+            params,
+        )
+        rows = cur.fetchall()
+
+    out: Dict[int, Dict[str, Any]] = {}
+    for row in rows:
+        rid, payload, report_md, narrative_md, stats_md, player_name, created_at, updated_at, report_generated_at, stats_updated_at, cached = row
+
+        # Reconstruct report_md from split columns if they exist
+        if narrative_md and stats_md:
+            report_md = narrative_md + "\n\n" + stats_md
+        elif not report_md:
+            report_md = ""
+
+        if payload and isinstance(payload, dict):
+            if "report_md" not in payload:
+                payload["report_md"] = report_md or ""
+            if "cached" not in payload:
+                payload["cached"] = bool(cached)
+            if "created_at" not in payload and created_at:
+                payload["created_at"] = created_at.isoformat()
+            if "updated_at" not in payload:
+                payload["updated_at"] = updated_at.isoformat() if updated_at else (created_at.isoformat() if created_at else None)
+            if "report_generated_at" not in payload:
+                payload["report_generated_at"] = report_generated_at.isoformat() if report_generated_at else (created_at.isoformat() if created_at else None)
+            if "stats_updated_at" not in payload:
+                payload["stats_updated_at"] = stats_updated_at.isoformat() if stats_updated_at else (updated_at.isoformat() if updated_at else (created_at.isoformat() if created_at else None))
+            out[int(rid)] = payload
+        else:
+            out[int(rid)] = {
+                "player": player_name,
+                "report_md": report_md or "",
+                "cached": bool(cached),
+                "created_at": created_at.isoformat() if created_at else None,
+                "updated_at": updated_at.isoformat() if updated_at else (created_at.isoformat() if created_at else None),
+                "report_generated_at": report_generated_at.isoformat() if report_generated_at else (created_at.isoformat() if created_at else None),
+                "stats_updated_at": stats_updated_at.isoformat() if stats_updated_at else (updated_at.isoformat() if updated_at else (created_at.isoformat() if created_at else None)),
+            }
+    return out
+
+
 # ----------------------------
 # Cost Tracking (Production)
 # ----------------------------
@@ -1091,6 +1519,35 @@ def record_timing(name: str, ms: float) -> None:
         )
 
 
+def record_timings(samples: List[Tuple[str, float]]) -> None:
+    """Record multiple timing measurements in one connection checkout.
+
+    Equivalent to calling record_timing per sample, but pays for the pool
+    checkout once and batches the statements.
+    """
+    if not samples:
+        return
+    pool = _get_pool()
+    now = _utc_now_iso()
+    with pool.connection() as conn, conn.cursor() as cur:
+        cur.executemany(
+            """
+            INSERT INTO public.timings (name, count, total_ms, last_ms, first_seen, last_seen)
+            VALUES (%s, 1, %s, %s, %s, %s)
+            ON CONFLICT (name) DO UPDATE
+            SET count = public.timings.count + 1,
+                total_ms = public.timings.total_ms + EXCLUDED.total_ms,
+                last_ms = EXCLUDED.last_ms,
+                last_seen = EXCLUDED.last_seen
+            """,
+            [(name, ms, ms, now, now) for name, ms in samples],
+        )
+        cur.executemany(
+            "INSERT INTO public.timing_samples (name, ms, created_at) VALUES (%s, %s, %s)",
+            [(name, ms, now) for name, ms in samples],
+        )
+
+
 def get_timing(name: str) -> Optional[dict]:
     """Get timing summary from PostgreSQL"""
     pool = _get_pool()
@@ -48,14 +48,34 @@ CREATE TABLE IF NOT EXISTS public.reports (
     UNIQUE(user_id, query_key)
 );
 
+-- Normalized player name for indexed global-cache lookups.
+-- Populated by application writes (db.norm); backfill existing rows with a
+-- one-off job that applies utils.normalize.normalize_name to player_name.
+ALTER TABLE public.reports ADD COLUMN IF NOT EXISTS player_name_norm TEXT;
+
+-- Consonant signature (normalized name with vowels stripped) for
+-- typo-tolerant indexed bucket lookups before any fuzzy comparison.
+-- Populated by application writes (db.sig); backfill like player_name_norm.
+ALTER TABLE public.reports ADD COLUMN IF NOT EXISTS player_name_sig TEXT;
+
 -- Report indexes
 CREATE INDEX IF NOT EXISTS idx_reports_user_id ON public.reports(user_id);
+CREATE INDEX IF NOT EXISTS idx_reports_player_name_norm ON public.reports(player_name_norm, created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_reports_player_name_sig ON public.reports(player_name_sig);
+
+-- Trigram index for server-side fuzzy name candidate retrieval
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE INDEX IF NOT EXISTS idx_reports_player_name_norm_trgm ON public.reports USING gin (player_name_norm gin_trgm_ops);
 CREATE INDEX IF NOT EXISTS idx_reports_created_at ON public.reports(created_at DESC);
 CREATE INDEX IF NOT EXISTS idx_reports_updated_at ON public.reports(updated_at DESC);
 CREATE INDEX IF NOT EXISTS idx_reports_player_name ON public.reports(player_name);
 CREATE INDEX IF NOT EXISTS idx_reports_payload_gin ON public.reports USING gin(payload jsonb_path_ops);
 CREATE INDEX IF NOT EXISTS idx_reports_player_name_lower ON public.reports(LOWER(player_name));
 CREATE INDEX IF NOT EXISTS idx_reports_query_key ON public.reports(query_key);
+-- Serves the POST-LLM dedup lookup (WHERE user_id AND player_name
+-- ORDER BY created_at DESC, id DESC LIMIT 1) with a direct index
+-- descent instead of a heap scan + sort.
+CREATE INDEX IF NOT EXISTS idx_reports_user_player_created ON public.reports(user_id, player_name, created_at DESC, id DESC);
 
 -- =============================================================================
 -- COST TRACKING (Token Usage & LLM Monitoring)
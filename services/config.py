@@ -109,3 +109,27 @@ def setup_compression(app):
         Compress(app)
     except Exception:
         pass
+
+
+def setup_json(app):
+    """Route Flask's JSON handling through the orjson-backed helpers.
+
+    Report payloads are large (markdown + HTML + structured tables), so
+    jsonify serialization is a measurable slice of cached-path CPU. Falls
+    back silently to Flask's default provider on older Flask versions.
+    """
+    try:
+        from flask.json.provider import DefaultJSONProvider
+
+        from utils.fast_json import json_dumps, json_loads
+
+        class _FastJSONProvider(DefaultJSONProvider):
+            def dumps(self, obj, **kwargs):
+                return json_dumps(obj)
+
+            def loads(self, s, **kwargs):
+                return json_loads(s)
+
+        app.json = _FastJSONProvider(app)
+    except Exception:
+        pass
@@ -21,12 +21,17 @@ Routes Registered:
 - POST /api/save_suggestion - Save suggested report to library (free operation)
 """
 
+import functools
 import logging
+import threading
 import time
 import uuid
-import json
+
+from cachetools import TTLCache
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
-from flask import jsonify, request
+from flask import Response, g, has_request_context, jsonify, request, stream_with_context
+from psycopg.rows import dict_row
 
 # Import database operations
 from db import (
@@ -36,16 +41,19 @@ from db import (
     get_report,
     get_report_by_id,
     insert_report,
+    insert_report_from_source,
     make_query_key,
     refund_credits,
+    spend_credit_and_insert_report,
     spend_credits,
+    touch_or_insert_report,
     update_report_by_id,
     insert_cost_tracking,
 )
 import db
 
 # Import Scout LLM generation service
-from services.scout import get_or_generate_scout_report
+from services.scout import get_or_generate_scout_report, iso_to_epoch, stream_scout_report
 
 # Import utilities
 from utils.parse import (
@@ -57,8 +65,9 @@ from utils.parse import (
     _split_height_weight,
     extract_canonical_player,
 )
+from utils.fast_json import json_dumps, json_loads
 from utils.render import md_to_safe_html, ensure_parsed_payload
-from utils.normalize import normalize_name
+from utils.normalize import consonant_sig, normalize_name, normalize_name_cached
 from utils.stats_refresh import replace_stats_sections
 from utils.prompts import load_text_prompt
 from utils.metrics import increment_metric
@@ -78,11 +87,105 @@ from utils.embeddings import embed_text, store_embedding
 
 logger = logging.getLogger(__name__)
 
+# Derived fields expected on a fully-parsed payload; used to skip
+# re-extraction entirely when a cached payload already carries them.
+_PARSED_FIELDS = frozenset({"info_fields", "grades", "season_snapshot", "last3_games", "report_html"})
+
+# Fire-and-forget executor for post-persist side effects (embedding,
+# cost tracking) that the client response never reads. atexit's default
+# ThreadPoolExecutor handler drains queued work on shutdown.
+_BG = ThreadPoolExecutor(max_workers=4, thread_name_prefix="report-bg")
+
+# Negative cache for the global-cache stage: normalized player names that
+# recently missed every lookup tier. Repeat requests for the same novel
+# name skip the DB round-trip for 5 minutes; entries are invalidated the
+# moment a report for that name is persisted.
+_GLOBAL_MISS_CACHE = TTLCache(maxsize=4096, ttl=300)
+_GLOBAL_MISS_LOCK = threading.Lock()
+
+
+def _note_global_miss(player_norm: str) -> None:
+    with _GLOBAL_MISS_LOCK:
+        _GLOBAL_MISS_CACHE[player_norm] = True
+
+
+def _was_recent_global_miss(player_norm: str) -> bool:
+    with _GLOBAL_MISS_LOCK:
+        return player_norm in _GLOBAL_MISS_CACHE
+
+
+def _clear_global_miss(player_norm: str) -> None:
+    with _GLOBAL_MISS_LOCK:
+        _GLOBAL_MISS_CACHE.pop(player_norm, None)
+
+
+def _post_persist_side_effects(user_id, pg_id: int, payload: dict, player: str, query_obj: dict, client, model: str):
+    """Embedding + cost tracking for a freshly persisted report.
+
+    Runs on _BG off the request path; each step is independently
+    best-effort, mirroring the old inline try/except blocks.
+    """
+    try:
+        canonical_player = (payload.get("player") or payload.get("player_name") or player).strip()
+        embed_text_input = f"{canonical_player} {query_obj.get('team') or ''} {query_obj.get('league') or ''}".strip()
+        embedding_vector = embed_text(client, embed_text_input)
+        store_embedding(int(pg_id), embedding_vector)
+    except Exception:
+        pass
+
+    try:
+        usage = payload.get("usage", {})
+        if usage and usage.get("input_tokens") and usage.get("output_tokens"):
+            prices = get_model_prices(model)
+            estimated_cost = estimate_cost(usage, prices)
+            insert_cost_tracking(user_id=user_id, report_id=int(pg_id), model=model, input_tokens=usage["input_tokens"], output_tokens=usage["output_tokens"], estimated_cost=estimated_cost, player_name=payload.get("player") or payload.get("player_name") or player)
+    except Exception:
+        pass
+
 
 # ============================================================================
 # HELPER FUNCTIONS (Module-level for clarity)
 # ============================================================================
 
+def _request_balance(user_id) -> int:
+    """get_balance memoized on flask.g for the life of one request.
+
+    A scout request can read the balance several times (pre-check, 402
+    branches, credits_remaining on cached payloads); all but the first
+    become a dict probe. Credit mutations must push the fresh balance via
+    _seed_request_balance.
+    """
+    if not has_request_context():
+        return get_balance(user_id)
+    cache = getattr(g, "_balance_cache", None)
+    if cache is None:
+        cache = g._balance_cache = {}
+    if user_id not in cache:
+        cache[user_id] = get_balance(user_id)
+    return cache[user_id]
+
+
+def _seed_request_balance(user_id, balance) -> None:
+    """Record a balance just returned by a credit mutation (or prefetch)."""
+    if balance is None or not has_request_context():
+        return
+    cache = getattr(g, "_balance_cache", None)
+    if cache is None:
+        cache = g._balance_cache = {}
+    cache[user_id] = int(balance)
+
+
+@functools.lru_cache(maxsize=2048)
+def _render_html(report_md: str) -> str:
+    """Render display HTML for a report, memoized on the markdown itself.
+
+    extract_display_md + md_to_safe_html are deterministic and CPU-bound
+    (regex sweeps plus bleach sanitization), so returning the same cached
+    report repeatedly becomes a dict lookup.
+    """
+    return md_to_safe_html(extract_display_md(report_md or ""))
+
+
 def _canonical_player_name(name: str) -> str:
     """Canonicalize player name for deduplication using normalization.
     
@@ -95,7 +198,7 @@ def _canonical_player_name(name: str) -> str:
     Returns:
         Normalized player name with extra whitespace removed
     """
-    norm = normalize_name(name, transliterate=True)
+    norm = normalize_name_cached(name, transliterate=True)
     parts = [p for p in norm.split() if p]
     return " ".join(parts)
 
@@ -110,19 +213,19 @@ def _handle_suggestion_acceptance(user_id: int, suggestion_report_id: int, playe
     Returns:
         tuple: (response_dict, status_code) or None if not applicable
     """
-    logger.info(f"[ACCEPT_SUGGESTION] Starting for report_id={suggestion_report_id}, player='{player}'")
-    
+    logger.info("[ACCEPT_SUGGESTION] Starting for report_id=%s, player='%s'", suggestion_report_id, player)
+
     # Fetch the source report from database
-    logger.info(f"[ACCEPT_SUGGESTION] Fetching source report from Postgres...")
+    logger.info("[ACCEPT_SUGGESTION] Fetching source report from Postgres...")
     source_report = None
     try:
         source_report = get_report_by_id(suggestion_report_id)
-        logger.info(f"[ACCEPT_SUGGESTION] Postgres fetch: {'SUCCESS' if source_report else 'NOT_FOUND'}")
+        logger.info("[ACCEPT_SUGGESTION] Postgres fetch: %s", "SUCCESS" if source_report else "NOT_FOUND")
     except Exception:
         source_report = None
 
     if not source_report:
-        logger.error(f"[ACCEPT_SUGGESTION] Report {suggestion_report_id} not found")
+        logger.error("[ACCEPT_SUGGESTION] Report %s not found", suggestion_report_id)
         return ({"error": "Suggested report not found"}, 404)
     
     # If the suggestion points to a report owned by the same user,
@@ -134,7 +237,9 @@ def _handle_suggestion_acceptance(user_id: int, suggestion_report_id: int, playe
     
     if source_owner and str(source_owner) == str(user_id):
         logger.info(
-            f"[ACCEPT_SUGGESTION] Same-user source (user_id={user_id}, report_id={suggestion_report_id}) → returning FREE"
+            "[ACCEPT_SUGGESTION] Same-user source (user_id=%s, report_id=%s) → returning FREE",
+            user_id,
+            suggestion_report_id,
         )
         existing_payload = dict(source_report)
         try:
@@ -144,23 +249,22 @@ def _handle_suggestion_acceptance(user_id: int, suggestion_report_id: int, playe
         payload["cached"] = True
         payload["report_id"] = suggestion_report_id
         payload["library_id"] = suggestion_report_id
-        payload["credits_remaining"] = get_balance(user_id)
+        payload["credits_remaining"] = _request_balance(user_id)
         
         # Ensure HTML is present
         try:
-            display_md = extract_display_md(payload.get("report_md", "") or "")
-            payload["report_html"] = md_to_safe_html(display_md)
+            payload["report_html"] = _render_html(payload.get("report_md", "") or "")
         except Exception:
             payload.setdefault("report_html", "")
         return (payload, 200)
     
     # Check if user already has a report with the SOURCE report's canonical name
-    logger.info(f"[ACCEPT_SUGGESTION] Checking if user already has this report...")
+    logger.info("[ACCEPT_SUGGESTION] Checking if user already has this report...")
     source_player_name = source_report.get("player", "")
 
     # Use SOURCE report's player name (the correct one without typos)
     canonical_query_player = _canonical_player_name(source_player_name)
-    logger.info(f"[ACCEPT_SUGGESTION] Checking for existing report with canonical_player='{canonical_query_player}'")
+    logger.info("[ACCEPT_SUGGESTION] Checking for existing report with canonical_player='%s'", canonical_query_player)
     
     existing_query_obj = {
         "player": canonical_query_player,
@@ -174,7 +278,7 @@ def _handle_suggestion_acceptance(user_id: int, suggestion_report_id: int, playe
     
     if existing_by_key:
         # User already has this report (by canonical name) — return FREE without charging
-        logger.info(f"[ACCEPT_SUGGESTION] User already has this report (id={existing_by_key.get('id')}) → returning FREE")
+        logger.info("[ACCEPT_SUGGESTION] User already has this report (id=%s) → returning FREE", existing_by_key.get("id"))
         existing_payload = existing_by_key.get("payload") or {}
         existing_payload["report_md"] = existing_by_key.get("report_md") or existing_payload.get("report_md", "")
         try:
@@ -186,106 +290,85 @@ def _handle_suggestion_acceptance(user_id: int, suggestion_report_id: int, playe
         payload["created_at"] = existing_by_key.get("created_at")
         payload["report_id"] = existing_by_key.get("id")
         payload["library_id"] = existing_by_key.get("id")
-        payload["credits_remaining"] = get_balance(user_id)
+        payload["credits_remaining"] = _request_balance(user_id)
         
         # Ensure HTML is present
         try:
-            display_md = extract_display_md(existing_payload.get("report_md", "") or "")
-            payload["report_html"] = md_to_safe_html(display_md)
+            payload["report_html"] = _render_html(existing_payload.get("report_md", "") or "")
         except Exception:
             payload.setdefault("report_html", "")
         
         return (payload, 200)
     
     # No existing report with this canonical name — charge 1 credit and save as new
-    logger.info(f"[ACCEPT_SUGGESTION] User doesn't have this report → charging 1 credit...")
+    logger.info("[ACCEPT_SUGGESTION] User doesn't have this report → charging 1 credit...")
+    source_payload = source_report or {}
+    source_md = source_payload.get("report_md", "")
+    source_player_name = source_report.get("player") or player
+
+    # Prepare payload for insertion in one expression (no copy-then-mutate)
+    # — use SOURCE report's proper name; cached=False since user paid 1 credit
+    payload = {
+        **source_payload,
+        "cached": False,
+        "report_md": source_md,
+        "player": source_player_name,
+        "player_name": source_player_name,
+        "team": team,
+    }
+
+    # Parse structured fields from markdown if missing
     try:
-        new_balance = spend_credits(
+        payload = ensure_parsed_payload(payload)
+    except Exception:
+        pass
+
+    insert_query_obj = {
+        "player": canonical_query_player,
+        "team": team,
+        "league": league,
+        "season": season,
+        "use_web": True,
+    }
+
+    # Charge and persist atomically: the ledger row and the report row commit
+    # together, so a failed save never leaves a charge behind (no refund path).
+    try:
+        saved = spend_credit_and_insert_report(
             user_id,
             1,
             reason="accept_suggestion",
             source_type="scout_request",
             source_id=f"accept_suggestion_{suggestion_report_id}",
-        )
-    except ValueError as e:
-        if "INSUFFICIENT_CREDITS" in str(e):
-            return ({"error": "Insufficient credits"}, 402)
-        raise
-    
-    # Save the suggestion to the current user's library
-    try:
-        source_payload = source_report or {}
-        source_md = source_payload.get("report_md", "")
-        
-        # Prepare payload for insertion - use SOURCE report's proper name
-        payload = dict(source_payload)
-        payload["cached"] = False  # User paid 1 credit
-        payload["report_md"] = source_md
-        source_player_name = source_report.get("player") or player
-        payload["player"] = source_player_name
-        payload["player_name"] = source_player_name
-        payload["team"] = team
-        
-        # Parse structured fields from markdown if missing
-        try:
-            payload = ensure_parsed_payload(payload)
-        except Exception:
-            pass
-        
-        insert_query_obj = {
-            "player": canonical_query_player,
-            "team": team,
-            "league": league,
-            "season": season,
-            "use_web": True,
-        }
-        
-        pg_id = insert_report(
-            user_id=user_id,
             player_name=source_player_name,
             query_obj=insert_query_obj,
             report_md=source_md,
             payload=payload,
             cached=False,
         )
-        
-        # Fetch the newly saved report to get the fresh created_at timestamp
-        try:
-            saved_report = get_report(user_id, int(pg_id))
-            if saved_report and saved_report.get("created_at"):
-                payload["created_at"] = saved_report["created_at"]
-        except Exception as e:
-            logger.warning(f"Failed to fetch created_at for saved suggestion: {e}")
-            payload["created_at"] = source_report.get("created_at")
-        
-        # Update payload with IDs and credits for return
-        payload["report_id"] = pg_id
-        payload["library_id"] = pg_id
-        payload["credits_remaining"] = new_balance
-        
-        # Ensure HTML is present
-        try:
-            display_md = extract_display_md(source_md or "")
-            payload["report_html"] = md_to_safe_html(display_md)
-        except Exception:
-            payload.setdefault("report_html", "")
-        
-        return (payload, 200)
+    except ValueError as e:
+        if "INSUFFICIENT_CREDITS" in str(e):
+            return ({"error": "Insufficient credits"}, 402)
+        raise
     except Exception as e:
         logger.error("Failed to save accepted suggestion: %s", e)
-        # Refund the credit on failure
-        try:
-            refund_credits(
-                user_id,
-                1,
-                reason="refund_suggestion_save_failed",
-                source_type="scout_request_refund",
-                source_id=f"accept_suggestion_{suggestion_report_id}:refund",
-            )
-        except Exception:
-            pass
         return ({"error": f"Failed to save suggestion: {str(e)}"}, 500)
 
+    # Update payload with IDs and credits for return
+    payload["created_at"] = saved.get("created_at") or source_report.get("created_at")
+    payload["report_id"] = saved["id"]
+    payload["library_id"] = saved["id"]
+    payload["credits_remaining"] = saved["balance"]
+    _seed_request_balance(user_id, saved["balance"])
+
+    # Ensure HTML is present
+    try:
+        payload["report_html"] = _render_html(source_md or "")
+    except Exception:
+        payload.setdefault("report_html", "")
+
+    return (payload, 200)
+
 
 def _check_user_library(user_id: int, player: str, team: str, league: str, season: str, use_web: bool):
     """
@@ -297,7 +380,7 @@ def _check_user_library(user_id: int, player: str, team: str, league: str, seaso
         tuple: (existing_report_dict or None, canonical_player_name, query_key, query_obj)
     """
     canonical_query_player = _canonical_player_name(player)
-    logger.info(f"[FLOW] Canonical player='{canonical_query_player}'")
+    logger.info("[FLOW] Canonical player='%s'", canonical_query_player)
 
     # Build query object for library lookup
     query_obj = {
@@ -312,44 +395,84 @@ def _check_user_library(user_id: int, player: str, team: str, league: str, seaso
     player_only_check = None
     try:
         with _get_pool().connection() as conn, conn.cursor() as cur:
+            # Two-step lookup: scan narrow rows (the matching loop only needs
+            # the query JSON), then fetch the heavy payload/report_md columns
+            # by PK for the single winner. Avoids shipping up to 50 payloads
+            # over the wire just to discard all but one.
+            # The credit balance rides along as a subselect so the later
+            # pre-check costs no extra round-trip; LEFT JOIN LATERAL keeps
+            # one balance-bearing row even when the library is empty.
             cur.execute(
                 """
-                SELECT id, payload, report_md, player_name, created_at, updated_at, cached, query
-                FROM public.reports
-                WHERE user_id = %s
-                ORDER BY created_at DESC
-                LIMIT 50
+                SELECT (SELECT balance FROM public.user_credits WHERE user_id = %s) AS balance,
+                       r.id, r.query
+                FROM (SELECT 1) AS one
+                LEFT JOIN LATERAL (
+                    SELECT id, query
+                    FROM public.reports
+                    WHERE user_id = %s
+                    ORDER BY created_at DESC
+                    LIMIT 50
+                ) r ON true
                 """,
-                (user_id,),
+                (user_id, user_id),
+                prepare=True,  # hot read: skip re-parse/re-plan per request
             )
             rows = cur.fetchall()
-            
-            for row in rows:
-                rid, payload, report_md, player_name, created_at, updated_at, cached, query_json = row
+
+            if rows:
+                _seed_request_balance(user_id, int(rows[0][0] or 0))
+
+            matched_id = None
+            matched_canonical = None
+            for _, rid, query_json in rows:
+                if rid is None:
+                    continue
                 try:
-                    query_dict = json.loads(query_json) if isinstance(query_json, str) else query_json
+                    query_dict = json_loads(query_json) if isinstance(query_json, str) else query_json
                     existing_canonical = query_dict.get("player", "").strip()
-                    
+
                     if existing_canonical and names_match(canonical_query_player, existing_canonical):
-                        player_only_check = {
-                            "id": int(rid),
-                            "payload": payload,
-                            "report_md": report_md or "",
-                            "player_name": player_name or "",
-                            "created_at": created_at.isoformat() if created_at else None,
-                            "updated_at": updated_at.isoformat() if updated_at else (created_at.isoformat() if created_at else None),
-                            "cached": bool(cached),
-                        }
-                        logger.info(f"[PLAYER CHECK] Found existing report for '{canonical_query_player}' → matched '{existing_canonical}' (id={rid})")
+                        matched_id = int(rid)
+                        matched_canonical = existing_canonical
                         break
                 except Exception:
                     continue
+
+            if matched_id is not None:
+                cur.execute(
+                    """
+                    SELECT payload, report_md, player_name, created_at, updated_at, cached
+                    FROM public.reports
+                    WHERE id = %s
+                    """,
+                    (matched_id,),
+                    prepare=True,
+                )
+                row = cur.fetchone()
+                if row:
+                    payload, report_md, player_name, created_at, updated_at, cached = row
+                    player_only_check = {
+                        "id": matched_id,
+                        "payload": payload,
+                        "report_md": report_md or "",
+                        "player_name": player_name or "",
+                        "created_at": created_at.isoformat() if created_at else None,
+                        "updated_at": updated_at.isoformat() if updated_at else (created_at.isoformat() if created_at else None),
+                        "cached": bool(cached),
+                    }
+                    logger.info(
+                        "[PLAYER CHECK] Found existing report for '%s' → matched '%s' (id=%s)",
+                        canonical_query_player,
+                        matched_canonical,
+                        matched_id,
+                    )
     except Exception as e:
-        logger.warning(f"[PLAYER CHECK] Lookup failed: {e}")
-    
+        logger.warning("[PLAYER CHECK] Lookup failed: %s", e)
+
     existing = player_only_check if player_only_check else find_report_by_query_key(user_id, query_key)
-    logger.info(f"[FLOW] Player-name check: {'HIT' if player_only_check else 'MISS'}")
-    logger.info(f"[MATCH] Query key lookup: {'HIT' if existing else 'MISS'}")
+    logger.info("[FLOW] Player-name check: %s", "HIT" if player_only_check else "MISS")
+    logger.info("[MATCH] Query key lookup: %s", "HIT" if existing else "MISS")
     
     return existing, canonical_query_player, query_key, query_obj
 
@@ -364,27 +487,25 @@ def _handle_cached_report(user_id: int, existing: dict, player: str, refresh_sta
     owned_payload = existing.get("payload") or {}
     owned_payload["report_md"] = existing.get("report_md") or owned_payload.get("report_md", "")
 
-    try:
-        display_md = extract_display_md(owned_payload.get("report_md", "") or "")
-        owned_payload["report_html"] = md_to_safe_html(display_md)
-    except Exception:
-        owned_payload.setdefault("report_html", "")
-
-    try:
+    # Single membership check: only touch the markdown when derived fields
+    # are actually absent. Payloads parsed at write time skip all regex work.
+    missing = _PARSED_FIELDS - owned_payload.keys()
+    if missing:
         report_md_local = owned_payload.get("report_md", "") or ""
-        
-        if not owned_payload.get("info_fields"):
+
+        if "report_html" in missing:
+            try:
+                owned_payload["report_html"] = _render_html(report_md_local)
+            except Exception:
+                owned_payload.setdefault("report_html", "")
+
+        if "info_fields" in missing:
             try:
                 owned_payload["info_fields"] = extract_info_fields(report_md_local)
             except Exception:
                 owned_payload["info_fields"] = {}
-        
-        try:
-            _split_height_weight(owned_payload.get("info_fields", {}))
-        except Exception:
-            pass
 
-        if not owned_payload.get("grades"):
+        if "grades" in missing:
             try:
                 grades_local, final_verdict_local = extract_grades(report_md_local)
                 owned_payload["grades"] = grades_local
@@ -393,17 +514,21 @@ def _handle_cached_report(user_id: int, existing: dict, player: str, refresh_sta
                 owned_payload["grades"] = []
                 owned_payload.setdefault("final_verdict", "")
 
-        if not owned_payload.get("season_snapshot"):
+        if "season_snapshot" in missing:
             try:
                 owned_payload["season_snapshot"] = extract_season_snapshot(report_md_local)
             except Exception:
                 owned_payload["season_snapshot"] = {}
 
-        if not owned_payload.get("last3_games"):
+        if "last3_games" in missing:
             try:
                 owned_payload["last3_games"] = extract_last3_games(report_md_local)
             except Exception:
                 owned_payload["last3_games"] = []
+
+    # Height/Weight may still be combined in older payloads
+    try:
+        _split_height_weight(owned_payload.get("info_fields", {}))
     except Exception:
         pass
 
@@ -420,7 +545,7 @@ def _handle_cached_report(user_id: int, existing: dict, player: str, refresh_sta
         increment_metric("cache_hits")
     except Exception:
         pass
-    owned_payload["credits_remaining"] = get_balance(user_id)
+    owned_payload["credits_remaining"] = _request_balance(user_id)
     
     # Check if stats are stale (>20s)
     report_md_for_refresh = existing.get("report_md") or ""
@@ -430,10 +555,8 @@ def _handle_cached_report(user_id: int, existing: dict, player: str, refresh_sta
     
     if updated_at_str:
         try:
-            updated_at = datetime.fromisoformat(updated_at_str.replace('Z', '+00:00'))
-            age = datetime.now(timezone.utc) - updated_at
-            report_age_seconds = age.total_seconds()
-            if age > timedelta(seconds=20):
+            report_age_seconds = time.time() - iso_to_epoch(updated_at_str)
+            if report_age_seconds > 20:
                 stats_are_stale = True
         except Exception:
             pass
@@ -444,18 +567,20 @@ def _handle_cached_report(user_id: int, existing: dict, player: str, refresh_sta
         return (owned_payload, 200)
     
     if stats_are_stale and refresh_stats and client:
-        logger.info(f"[STATS_REFRESH] Starting stats refresh for {player}")
+        logger.info("[STATS_REFRESH] Starting stats refresh for %s", player)
         try:
             new_balance = spend_credits(user_id, 1, reason="stats_refresh", source_type="stats_refresh", source_id=f"stats_refresh_{existing.get('id')}_{int(time.time())}")
+            _seed_request_balance(user_id, new_balance)
             owned_payload["credits_remaining"] = new_balance
-            logger.info(f"[STATS_REFRESH] Credit charged, new balance: {new_balance}")
+            logger.info("[STATS_REFRESH] Credit charged, new balance: %s", new_balance)
 
-            logger.info(f"[STATS_REFRESH] Loading stats refresh prompt template")
+            logger.info("[STATS_REFRESH] Loading stats refresh prompt template")
             stats_prompt_template = load_text_prompt("prompts/stats_refresh.txt")
             stats_user_prompt = stats_prompt_template.format(player_name=existing.get("player_name") or player, last_updated=updated_at_str or "unknown")
-            logger.info(f"[STATS_REFRESH] Prompt prepared ({len(stats_user_prompt)} chars)")
-            
-            logger.info(f"[STATS_REFRESH] Calling LLM for stats update (model={model})")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("[STATS_REFRESH] Prompt prepared (%d chars)", len(stats_user_prompt))
+
+            logger.info("[STATS_REFRESH] Calling LLM for stats update (model=%s)", model)
             # Use OpenAI API format
             response = client.chat.completions.create(
                 model=model,
@@ -466,9 +591,10 @@ def _handle_cached_report(user_id: int, existing: dict, player: str, refresh_sta
                 temperature=0.7,
                 max_completion_tokens=2000
             )
-            logger.info(f"[STATS_REFRESH] LLM call completed successfully")
+            logger.info("[STATS_REFRESH] LLM call completed successfully")
             fresh_stats_md = response.choices[0].message.content or ""
-            logger.info(f"[STATS_REFRESH] LLM returned {len(fresh_stats_md)} characters")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("[STATS_REFRESH] LLM returned %d characters", len(fresh_stats_md))
             
             # Track cost for stats refresh
             try:
@@ -488,16 +614,16 @@ def _handle_cached_report(user_id: int, existing: dict, player: str, refresh_sta
                         player_name=existing.get("player_name") or player,
                         operation_type="refresh"
                     )
-                    logger.info(f"[STATS_REFRESH] Cost tracked: ${estimated_cost:.6f} ({input_tokens} in, {output_tokens} out)")
+                    logger.info("[STATS_REFRESH] Cost tracked: $%.6f (%s in, %s out)", estimated_cost, input_tokens, output_tokens)
             except Exception as e:
-                logger.warning(f"[STATS_REFRESH] Failed to track cost: {e}")
-            
-            logger.info(f"[STATS_REFRESH] Replacing stats sections in report")
+                logger.warning("[STATS_REFRESH] Failed to track cost: %s", e)
+
+            logger.info("[STATS_REFRESH] Replacing stats sections in report")
             updated_report_md = replace_stats_sections(report_md_for_refresh, fresh_stats_md)
-            logger.info(f"[STATS_REFRESH] Stats sections replaced")
+            logger.info("[STATS_REFRESH] Stats sections replaced")
 
             if updated_report_md != report_md_for_refresh:
-                logger.info(f"[STATS_REFRESH] Report changed, updating database for report_id={existing.get('id')}")
+                logger.info("[STATS_REFRESH] Report changed, updating database for report_id=%s", existing.get("id"))
                 payload_obj = existing.get("payload") or {}
                 # Persist refresh timestamp in payload for library loads
                 payload_obj["stats_refreshed_at"] = datetime.now(timezone.utc).isoformat()
@@ -511,7 +637,7 @@ def _handle_cached_report(user_id: int, existing: dict, player: str, refresh_sta
                     update_generated_at=False,  # Don't change generation time
                     update_stats_updated_at=True,  # Update stats timestamp
                 )
-                logger.info(f"[STATS_REFRESH] Database updated successfully")
+                logger.info("[STATS_REFRESH] Database updated successfully")
 
                 # Re-fetch full payload to get fresh extracted fields (season_snapshot, last3_games, etc.)
                 try:
@@ -521,39 +647,43 @@ def _handle_cached_report(user_id: int, existing: dict, player: str, refresh_sta
                         owned_payload = refreshed_payload
                         # Set stats_refreshed_at to current time (not old updated_at)
                         owned_payload["stats_refreshed_at"] = datetime.now(timezone.utc).isoformat()
-                        logger.info(f"[STATS_REFRESH] Payload refreshed with fresh extracted fields")
+                        logger.info("[STATS_REFRESH] Payload refreshed with fresh extracted fields")
                     else:
                         # Fallback: manually update if fetch fails
                         owned_payload["report_md"] = updated_report_md
                         owned_payload["stats_refreshed_at"] = datetime.now(timezone.utc).isoformat()
-                        display_md = extract_display_md(updated_report_md)
-                        owned_payload["report_html"] = md_to_safe_html(display_md)
-                        logger.info(f"[STATS_REFRESH] HTML regenerated (manual fallback)")
+                        owned_payload["report_html"] = _render_html(updated_report_md)
+                        logger.info("[STATS_REFRESH] HTML regenerated (manual fallback)")
                 except Exception as e:
-                    logger.warning(f"[STATS_REFRESH] Failed to refresh payload, using manual update: {e}")
+                    logger.warning("[STATS_REFRESH] Failed to refresh payload, using manual update: %s", e)
                     # Fallback: manually update
                     owned_payload["report_md"] = updated_report_md
                     owned_payload["stats_refreshed_at"] = datetime.now(timezone.utc).isoformat()
                     try:
-                        display_md = extract_display_md(updated_report_md)
-                        owned_payload["report_html"] = md_to_safe_html(display_md)
-                        logger.info(f"[STATS_REFRESH] HTML regenerated (exception fallback)")
+                        owned_payload["report_html"] = _render_html(updated_report_md)
+                        logger.info("[STATS_REFRESH] HTML regenerated (exception fallback)")
                     except Exception as e2:
-                        logger.warning(f"[STATS_REFRESH] Failed to regenerate HTML: {e2}")
+                        logger.warning("[STATS_REFRESH] Failed to regenerate HTML: %s", e2)
             else:
-                logger.warning(f"[STATS_REFRESH] LLM returned no changes to stats sections")
+                logger.warning("[STATS_REFRESH] LLM returned no changes to stats sections")
         except ValueError as e:
-            logger.error(f"[STATS_REFRESH] ValueError during stats refresh: {e}")
+            logger.error("[STATS_REFRESH] ValueError during stats refresh: %s", e)
             if "INSUFFICIENT_CREDITS" in str(e):
                 return ({"error": "Insufficient credits"}, 402)
             raise  # Re-raise if not insufficient credits
         except Exception as e:
-            logger.error(f"[STATS_REFRESH] Exception during stats refresh: {type(e).__name__}: {e}", exc_info=True)
+            logger.error("[STATS_REFRESH] Exception during stats refresh: %s: %s", type(e).__name__, e, exc_info=True)
             # Return error to frontend instead of silently failing
             return ({"error": f"Stats refresh failed: {str(e)}"}, 500)
-    
+
     # Log what's being returned for badge debugging
-    logger.info(f"[STATS_REFRESH] Returning payload with stats_refreshed_at={owned_payload.get('stats_refreshed_at')}, updated_at={owned_payload.get('updated_at')}, created_at={owned_payload.get('created_at')}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "[STATS_REFRESH] Returning payload with stats_refreshed_at=%s, updated_at=%s, created_at=%s",
+            owned_payload.get("stats_refreshed_at"),
+            owned_payload.get("updated_at"),
+            owned_payload.get("created_at"),
+        )
     return (owned_payload, 200)
 
 
@@ -594,7 +724,7 @@ def _try_similarity_matching(user_id: int, player: str, team: str, league: str,
                         payload = ensure_parsed_payload(payload)
                     except Exception:
                         pass
-                    payload["credits_remaining"] = get_balance(user_id)
+                    payload["credits_remaining"] = _request_balance(user_id)
                     return (payload, 200)
                 elif embed_similar.get("type") == "suggest":
                     suggestion_payload = fetch_report_payload(user_id, int(embed_similar.get("report_id")))
@@ -607,7 +737,7 @@ def _try_similarity_matching(user_id: int, player: str, team: str, league: str,
                             "score": embed_similar.get("score"),
                         },
                         "auto_matched": False,
-                        "credits_remaining": get_balance(user_id),
+                        "credits_remaining": _request_balance(user_id),
                         "note": "Similar player found in your library",
                     }, 200)
         except Exception:
@@ -637,7 +767,7 @@ def _try_similarity_matching(user_id: int, player: str, team: str, league: str,
                     payload = ensure_parsed_payload(payload)
                 except Exception:
                     pass
-                payload["credits_remaining"] = get_balance(user_id)
+                payload["credits_remaining"] = _request_balance(user_id)
                 return (payload, 200)
             elif pre_similar.get("type") == "suggest" and pre_similar.get("score") == 100:
                 return _handle_exact_match_suggestion(user_id, pre_similar, query_key, query_obj)
@@ -653,7 +783,7 @@ def _try_similarity_matching(user_id: int, player: str, team: str, league: str,
                         "report_payload": suggestion_payload,
                     },
                     "auto_matched": False,
-                    "credits_remaining": get_balance(user_id),
+                    "credits_remaining": _request_balance(user_id),
                 }, 200)
     except Exception:
         pass
@@ -668,39 +798,34 @@ def _handle_exact_match_suggestion(user_id: int, pre_similar: dict, query_key: s
     if suggestion_payload:
         try:
             new_balance = spend_credits(user_id, 1, reason="scout_exact_match", source_type="scout_request", source_id=f"exact_match_{pre_similar.get('report_id')}")
+            _seed_request_balance(user_id, new_balance)
         except ValueError as e:
             if "INSUFFICIENT_CREDITS" in str(e):
-                return ({"error": "Insufficient credits. Please top up.", "credits": get_balance(user_id)}, 402)
+                return ({"error": "Insufficient credits. Please top up.", "credits": _request_balance(user_id)}, 402)
             raise
         
         user_report_id = None
         try:
-            existing_copy = find_report_by_query_key(user_id, query_key)
-            if existing_copy:
-                user_report_id = existing_copy.get("id")
-            else:
-                source_md = suggestion_payload.get("report_md", "")
-                payload = dict(suggestion_payload)
-                payload["cached"] = True
-                payload["report_md"] = source_md
-                if not payload.get("player"):
-                    payload["player"] = pre_similar.get("player_name")
-                
-                try:
-                    payload = ensure_parsed_payload(payload)
-                except Exception:
-                    pass
-                
-                user_report_id = insert_report(user_id=user_id, player_name=pre_similar.get("player_name"), query_obj=query_obj, report_md=source_md, payload=payload, cached=True)
-                payload["report_id"] = user_report_id
-                payload["cached"] = True
-                
-                try:
-                    saved_report = get_report(user_id, int(user_report_id))
-                    if saved_report and saved_report.get("created_at"):
-                        payload["created_at"] = saved_report["created_at"]
-                except Exception:
-                    pass
+            source_md = suggestion_payload.get("report_md", "")
+            payload = dict(suggestion_payload)
+            payload["cached"] = True
+            payload["report_md"] = source_md
+            if not payload.get("player"):
+                payload["player"] = pre_similar.get("player_name")
+
+            try:
+                payload = ensure_parsed_payload(payload)
+            except Exception:
+                pass
+
+            # Single round-trip: inserts the copy or, if the user already has
+            # this query_key, keeps the existing row and returns its id.
+            saved = touch_or_insert_report(user_id=user_id, player_name=pre_similar.get("player_name"), query_obj=query_obj, report_md=source_md, payload=payload, cached=True)
+            user_report_id = saved["id"]
+            payload["report_id"] = user_report_id
+            payload["cached"] = True
+            if saved.get("created_at"):
+                payload["created_at"] = saved["created_at"]
         except Exception:
             pass
         
@@ -723,95 +848,128 @@ def _check_global_cache(user_id: int, player: str, query_key: str, query_obj: di
     if refresh:
         return None, None
     
+    player_norm = normalize_name_cached(player, transliterate=True)
+    if _was_recent_global_miss(player_norm):
+        # This name missed every tier within the TTL and nobody has
+        # persisted a report for it since — skip the round-trip.
+        logger.info("[FLOW] Global cache stage skipped (recent miss)")
+        return None, None
+
     logger.info("[FLOW] Global cache stage")
     global_cached_report = None
+    lookup_ran = False
     try:
         pool = _get_pool()
-        with pool.connection() as conn, conn.cursor() as cur:
-            cur.execute("SELECT id, payload, report_md, player_name, created_at, cached FROM public.reports WHERE query_key = %s ORDER BY created_at DESC, id DESC LIMIT 1", (query_key,))
-            row = cur.fetchone()
-            if row:
-                rid, payload, report_md, player_name, created_at, cached = row
-                global_cached_report = {
-                    "id": int(rid),
-                    "payload": payload,  
-                    "report_md": report_md or "",
-                    "player_name": player_name or "",
-                    "created_at": created_at.isoformat() if created_at else None,
-                    "cached": bool(cached),
-                }
-            
-            if not global_cached_report:
-                try:
-                    cur.execute("SELECT id, payload, report_md, player_name, created_at, cached FROM public.reports ORDER BY created_at DESC, id DESC LIMIT 100")
-                    rows = cur.fetchall() or []
-                except Exception:
-                    rows = []
-                
-                player_norm = normalize_name(player, transliterate=True)
-                for rid, payload, report_md, player_name, created_at, cached in rows:
-                    try:
-                        if names_match(player_norm, player_name or ""):
-                            global_cached_report = {
-                                "id": int(rid),
-                                "payload": payload,
-                                "report_md": (report_md or ""),
-                                "player_name": (player_name or ""),
-                                "created_at": created_at.isoformat() if created_at else None,
-                                "cached": bool(cached),
-                            }
+        with pool.connection() as conn:
+            # Read-only lookups: autocommit skips the implicit BEGIN/COMMIT
+            # round-trips. Restored before the connection is pooled again.
+            conn.autocommit = True
+            try:
+                # dict_row builds the row dicts at the C level, so the Python
+                # side does no per-field unpacking or dict assembly.
+                with conn.cursor(row_factory=dict_row) as cur:
+                    # All three lookup tiers (exact query_key, normalized name,
+                    # consonant-signature bucket) in ONE round-trip. Each
+                    # branch is an indexed probe; the source label lets Python
+                    # pick the highest-priority tier from a single result set.
+                    cur.execute(
+                        """
+                        (SELECT 'query_key' AS source, id, payload, report_md, player_name, created_at, cached
+                           FROM public.reports WHERE query_key = %s ORDER BY created_at DESC, id DESC LIMIT 1)
+                        UNION ALL
+                        (SELECT 'norm', id, payload, report_md, player_name, created_at, cached
+                           FROM public.reports WHERE player_name_norm = %s ORDER BY created_at DESC, id DESC LIMIT 1)
+                        UNION ALL
+                        (SELECT 'sig', id, payload, report_md, player_name, created_at, cached
+                           FROM public.reports WHERE player_name_sig = %s ORDER BY created_at DESC, id DESC LIMIT 5)
+                        """,
+                        (query_key, player_norm, consonant_sig(player)),
+                        prepare=True,  # hot read: skip re-parse/re-plan per request
+                    )
+                    rows = cur.fetchall()
+                    lookup_ran = True
+
+                    for source in ("query_key", "norm", "sig"):
+                        for row in rows:
+                            if row["source"] != source:
+                                continue
+                            if source == "sig" and not names_match(player, row["player_name"] or ""):
+                                # Signature bucket is typo-tolerant; confirm
+                                # the handful of survivors before trusting one.
+                                continue
+                            global_cached_report = row
+                            global_cached_report["id"] = int(row["id"])
+                            global_cached_report["report_md"] = row["report_md"] or ""
+                            global_cached_report["player_name"] = row["player_name"] or ""
+                            global_cached_report["created_at"] = row["created_at"].isoformat() if row["created_at"] else None
+                            global_cached_report["cached"] = bool(row["cached"])
                             break
-                    except Exception:
-                        continue
+                        if global_cached_report:
+                            break
+            finally:
+                conn.autocommit = False
     except Exception:
         pass
     
     if global_cached_report:
+        source_md = global_cached_report.get("report_md", "")
+        source_payload = global_cached_report.get("payload") or {}
+        # Single-pass merge instead of copy-then-mutate; the source dict
+        # (psycopg's decoded jsonb) is left untouched.
+        payload = {
+            **source_payload,
+            "cached": True,
+            "report_md": source_md,
+            "player": global_cached_report.get("player_name"),
+        }
+
+        try:
+            payload = ensure_parsed_payload(payload)
+        except Exception:
+            pass
+
+        # Charge + insert + balance refresh in one transaction/round-trip
+        # instead of spend_credits → insert_report → get_report. A failed
+        # insert rolls the charge back, so no refund path is needed.
         try:
-            new_balance = spend_credits(user_id, 1, reason="scout_global_cache", source_type="scout_request", source_id=f"global_cache_{global_cached_report['id']}")
+            saved = spend_credit_and_insert_report(
+                user_id, 1,
+                reason="scout_global_cache",
+                source_type="scout_request",
+                source_id=f"global_cache_{global_cached_report['id']}",
+                player_name=global_cached_report.get("player_name"),
+                query_obj=query_obj,
+                report_md=source_md,
+                payload=payload,
+                cached=True,
+            )
         except ValueError as e:
             if "INSUFFICIENT_CREDITS" in str(e):
-                return ({"error": "Insufficient credits. Please top up.", "credits": get_balance(user_id)}, 402)
+                return ({"error": "Insufficient credits. Please top up.", "credits": _request_balance(user_id)}, 402)
             raise
-        
+        except Exception:
+            return None, None
+
+        payload["report_id"] = saved["id"]
+        payload["cached"] = True
+        payload["credits_remaining"] = saved["balance"]
+        _seed_request_balance(user_id, saved["balance"])
+        if saved.get("created_at"):
+            payload["created_at"] = saved["created_at"]
+
         try:
-            source_md = global_cached_report.get("report_md", "")
-            source_payload = global_cached_report.get("payload") or {}
-            payload = dict(source_payload)
-            payload["cached"] = True
-            payload["report_md"] = source_md
-            payload["player"] = global_cached_report.get("player_name")
-            
-            try:
-                payload = ensure_parsed_payload(payload)
-            except Exception:
-                pass
-            
-            user_report_id = insert_report(user_id=user_id, player_name=global_cached_report.get("player_name"), query_obj=query_obj, report_md=source_md, payload=payload, cached=True)
-            payload["report_id"] = user_report_id
-            payload["cached"] = True
-            payload["credits_remaining"] = new_balance
-            
-            try:
-                saved_report = get_report(user_id, int(user_report_id))
-                if saved_report and saved_report.get("created_at"):
-                    payload["created_at"] = saved_report["created_at"]
-            except Exception:
-                pass
-            
-            try:
-                track_event(user_id, "report_gen_cached", {"player": player, "source_report_id": global_cached_report["id"], "cached": True})
-            except Exception:
-                pass
-            
-            return (payload, 200)
+            track_event(user_id, "report_gen_cached", {"player": player, "source_report_id": global_cached_report["id"], "cached": True})
         except Exception:
             pass
-    
+
+        return (payload, 200)
+
+    if lookup_ran:
+        _note_global_miss(player_norm)
     return None, None
 
 
-def _generate_report_with_llm(user_id: int, client, MODEL: str, SCOUT_INSTRUCTIONS: str, player: str, team: str, league: str, season: str, refresh: bool):
+def _generate_report_with_llm(user_id: int, generate, client, MODEL: str, player: str, team: str, league: str, season: str, refresh: bool):
     """
     Generate a new report using LLM.
     
@@ -827,7 +985,7 @@ def _generate_report_with_llm(user_id: int, client, MODEL: str, SCOUT_INSTRUCTIO
         return ({"error": "OpenAI generation disabled (set ENABLE_OPENAI=1 to enable)."}, 503)
 
     try:
-        payload = get_or_generate_scout_report(client=client, model=MODEL, scout_instructions=SCOUT_INSTRUCTIONS, player=player, team=team, league=league, season=season, use_web=True, refresh=refresh, user_id=user_id)
+        payload = generate(player=player, team=team, league=league, season=season, refresh=refresh, user_id=user_id)
     except Exception as e:
         try:
             track_event(user_id, "generation_failed", {"player": player, "error": str(e), "error_type": type(e).__name__})
@@ -857,7 +1015,7 @@ def _generate_report_with_llm(user_id: int, client, MODEL: str, SCOUT_INSTRUCTIO
                     payload = ensure_parsed_payload(payload)
                 except Exception:
                     pass
-                payload["credits_remaining"] = get_balance(user_id)
+                payload["credits_remaining"] = _request_balance(user_id)
                 return (payload, 200)
             elif fb.get("type") == "suggest":
                 fb_payload = None
@@ -875,7 +1033,7 @@ def _generate_report_with_llm(user_id: int, client, MODEL: str, SCOUT_INSTRUCTIO
                         "score": fb.get("score"),
                     },
                     "auto_matched": False,
-                    "credits_remaining": get_balance(user_id),
+                    "credits_remaining": _request_balance(user_id),
                     "note": "Original generation returned PLAYER_NOT_FOUND; a close cached match was found.",
                 }, 200)
 
@@ -884,6 +1042,59 @@ def _generate_report_with_llm(user_id: int, client, MODEL: str, SCOUT_INSTRUCTIO
     return (payload, 200)
 
 
+def _stream_generate_and_persist(user_id: int, client, MODEL: str, SCOUT_INSTRUCTIONS: str, player: str, team: str, league: str, season: str, canonical_query_player: str, query_obj: dict, refresh: bool, report_id_to_update: int, request_id: str):
+    """
+    SSE response for opt-in streaming generation (stream=true).
+
+    Streams `data:` frames with report-markdown deltas as they arrive so
+    the client sees first tokens in ~1s instead of waiting out the whole
+    generation, then charges/persists exactly like the blocking path and
+    closes with an `event: done` frame carrying the final payload (or an
+    `event: error` frame).
+    """
+    try:
+        track_event(user_id, "report_gen_started", {"player": player, "team": team, "league": league, "use_web": True, "refresh": refresh, "stream": True})
+    except Exception:
+        pass
+
+    def _events():
+        payload = None
+        try:
+            for kind, value in stream_scout_report(
+                client=client, model=MODEL, scout_instructions=SCOUT_INSTRUCTIONS,
+                player=player, team=team, league=league, season=season,
+                use_web=True, user_id=user_id,
+            ):
+                if kind == "delta":
+                    yield f"data: {json_dumps({'delta': value})}\n\n"
+                elif kind == "meta":
+                    # Header info fields parsed mid-stream; lets the UI
+                    # render player/team/league before the body finishes.
+                    yield f"event: meta\ndata: {json_dumps(value)}\n\n"
+                else:
+                    payload = value
+        except Exception as e:
+            try:
+                track_event(user_id, "generation_failed", {"player": player, "error": str(e), "error_type": type(e).__name__})
+            except Exception:
+                pass
+            yield f"event: error\ndata: {json_dumps({'error': str(e)})}\n\n"
+            return
+
+        report_md = ((payload or {}).get("report_md") or "").strip()
+        if not payload or report_md.startswith("PLAYER_NOT_FOUND:"):
+            yield f"event: error\ndata: {json_dumps({'error': report_md or 'Generation failed'})}\n\n"
+            return
+
+        result, status_code = _persist_and_charge_report(
+            user_id, payload, player, canonical_query_player, query_obj,
+            refresh, report_id_to_update, request_id, MODEL, client,
+        )
+        yield f"event: done\ndata: {json_dumps({'status': status_code, 'payload': result})}\n\n"
+
+    return Response(stream_with_context(_events()), mimetype="text/event-stream")
+
+
 def _persist_and_charge_report(user_id: int, payload: dict, player: str, canonical_query_player: str, query_obj: dict, refresh: bool, report_id_to_update: int, request_id: str, MODEL: str, client):
     """
     Charge credit and persist report to database.
@@ -892,41 +1103,37 @@ def _persist_and_charge_report(user_id: int, payload: dict, player: str, canonic
         tuple: (response_dict, status_code)
     """
     report_md = payload.get("report_md", "")
-    
-    try:
-        new_balance = spend_credits(user_id, 1, reason="report", source_type="scout_request", source_id=request_id)
-    except ValueError as e:
-        if str(e) == "INSUFFICIENT_CREDITS":
-            return ({"error": "Insufficient credits. Please top up.", "credits": get_balance(user_id)}, 402)
-        return ({"error": str(e)}, 500)
 
     try:
         payload["cached"] = False
         cached_flag = False
 
-        insert_query_obj = dict(query_obj)
-        insert_query_obj["use_web"] = True
-
         canonical_player = (payload.get("player") or payload.get("player_name") or player).strip()
-        insert_query_obj["player"] = canonical_query_player
+        insert_query_obj = {**query_obj, "use_web": True, "player": canonical_query_player}
 
         payload.setdefault("queried_player", player)
 
-        # POST-LLM CANONICAL DEDUP
+        # POST-LLM CANONICAL DEDUP — runs before the charge so a dedup hit
+        # never needs the spend-then-refund dance.
         if not refresh and not report_id_to_update:
             try:
                 pool = _get_pool()
-                with pool.connection() as conn, conn.cursor() as cur:
-                    cur.execute("SELECT id, payload, report_md, player_name, created_at, cached FROM public.reports WHERE user_id = %s AND player_name = %s ORDER BY created_at DESC, id DESC LIMIT 1", (user_id, canonical_player))
-                    existing_row = cur.fetchone()
+                with pool.connection() as conn:
+                    # Read-only dedup lookup: see _check_global_cache
+                    conn.autocommit = True
+                    try:
+                        with conn.cursor() as cur:
+                            cur.execute(
+                                "SELECT id, payload, report_md, player_name, created_at, cached FROM public.reports WHERE user_id = %s AND player_name = %s ORDER BY created_at DESC, id DESC LIMIT 1",
+                                (user_id, canonical_player),
+                                prepare=True,  # hot read: skip re-parse/re-plan per request
+                            )
+                            existing_row = cur.fetchone()
+                    finally:
+                        conn.autocommit = False
                     if existing_row:
                         existing_id = existing_row[0]
-                        
-                        try:
-                            refund_credits(user_id, 1, reason="post_llm_dedup", source_type="scout_request_refund", source_id=f"{request_id}:post_llm_dedup")
-                        except Exception:
-                            pass
-                        
+
                         existing_payload_dict = existing_row[1] or {}
                         existing_payload_dict["report_md"] = existing_row[2] or ""
                         try:
@@ -936,47 +1143,71 @@ def _persist_and_charge_report(user_id: int, payload: dict, player: str, canonic
                         existing_payload_dict["cached"] = bool(existing_row[5])
                         existing_payload_dict["report_id"] = int(existing_id)
                         existing_payload_dict["library_id"] = int(existing_id)
-                        existing_payload_dict["credits_remaining"] = get_balance(user_id)
+                        existing_payload_dict["credits_remaining"] = _request_balance(user_id)
                         return (existing_payload_dict, 200)
             except Exception:
                 pass
 
-        try:
-            if report_id_to_update and refresh:
-                pg_id = update_report_by_id(user_id=user_id, report_id=int(report_id_to_update), player_name=canonical_player, report_md=report_md, payload=payload, cached=cached_flag)
-                payload["refreshed"] = True
-            else:
-                pg_id = insert_report(user_id=user_id, player_name=canonical_player, query_obj=insert_query_obj, report_md=report_md, payload=payload, cached=cached_flag)
-            
+        if report_id_to_update and refresh:
             try:
-                saved_report = get_report(user_id, int(pg_id))
-                if saved_report and saved_report.get("created_at"):
-                    payload["created_at"] = saved_report["created_at"]
-            except Exception:
-                pass
-            
-            payload["library_id"] = int(pg_id)
-        except Exception as e:
+                new_balance = spend_credits(user_id, 1, reason="report", source_type="scout_request", source_id=request_id)
+                _seed_request_balance(user_id, new_balance)
+            except ValueError as e:
+                if str(e) == "INSUFFICIENT_CREDITS":
+                    return ({"error": "Insufficient credits. Please top up.", "credits": _request_balance(user_id)}, 402)
+                return ({"error": str(e)}, 500)
             try:
-                refund_credits(user_id, 1, reason="refund_postgres_failed", source_type="scout_request_refund", source_id=f"{request_id}:refund_pg")
-            except Exception:
-                pass
-            return ({"error": f"Failed to save report: {e}"}, 500)
-
-        try:
-            embed_text_input = f"{canonical_player} {query_obj.get('team') or ''} {query_obj.get('league') or ''}".strip()
-            embedding_vector = embed_text(client, embed_text_input)
-            target_id = int(pg_id)
-            store_embedding(target_id, embedding_vector)
-        except Exception:
-            pass
-
+                pg_id, saved_created_at = update_report_by_id(user_id=user_id, report_id=int(report_id_to_update), player_name=canonical_player, report_md=report_md, payload=payload, cached=cached_flag)
+                payload["refreshed"] = True
+                if saved_created_at is not None:
+                    payload["created_at"] = saved_created_at.isoformat()
+            except Exception as e:
+                try:
+                    refund_credits(user_id, 1, reason="refund_postgres_failed", source_type="scout_request_refund", source_id=f"{request_id}:refund_pg")
+                except Exception:
+                    pass
+                return ({"error": f"Failed to save report: {e}"}, 500)
+        else:
+            # Charge + insert + balance refresh in one transaction/round-trip
+            # (was spend_credits → insert_report → get_report → get_balance).
+            # The charge rolls back with a failed insert, so no refund path.
+            try:
+                saved = spend_credit_and_insert_report(
+                    user_id, 1,
+                    reason="report",
+                    source_type="scout_request",
+                    source_id=request_id,
+                    player_name=canonical_player,
+                    query_obj=insert_query_obj,
+                    report_md=report_md,
+                    payload=payload,
+                    cached=cached_flag,
+                )
+            except ValueError as e:
+                if str(e) == "INSUFFICIENT_CREDITS":
+                    return ({"error": "Insufficient credits. Please top up.", "credits": _request_balance(user_id)}, 402)
+                return ({"error": str(e)}, 500)
+            except Exception as e:
+                return ({"error": f"Failed to save report: {e}"}, 500)
+            pg_id = saved["id"]
+            new_balance = saved["balance"]
+            _seed_request_balance(user_id, new_balance)
+            if saved.get("created_at"):
+                payload["created_at"] = saved["created_at"]
+
+        payload["library_id"] = int(pg_id)
+
+        # A report for this name now exists globally — drop any negative
+        # cache entry so other users' lookups can find it immediately.
+        _clear_global_miss(normalize_name_cached(canonical_player, transliterate=True))
+        _clear_global_miss(normalize_name_cached(player, transliterate=True))
+
+        # Embedding + cost tracking are invisible to the response; hand them
+        # to the background executor instead of paying an OpenAI round-trip
+        # and two DB writes before returning. Snapshot the payload so later
+        # request-side mutations don't race the worker.
         try:
-            usage = payload.get("usage", {})
-            if usage and usage.get("input_tokens") and usage.get("output_tokens"):
-                prices = get_model_prices(MODEL)
-                estimated_cost = estimate_cost(usage, prices)
-                insert_cost_tracking(user_id=user_id, report_id=int(pg_id), model=MODEL, input_tokens=usage["input_tokens"], output_tokens=usage["output_tokens"], estimated_cost=estimated_cost, player_name=payload.get("player") or payload.get("player_name") or player)
+            _BG.submit(_post_persist_side_effects, user_id, int(pg_id), dict(payload), player, query_obj, client, MODEL)
         except Exception:
             pass
 
@@ -1001,6 +1232,15 @@ def create_reports_routes(app, require_user_id, client, MODEL, SCOUT_INSTRUCTION
         MODEL: Model name string (e.g., "claude-sonnet-4")
         SCOUT_INSTRUCTIONS: System prompt for LLM report generation
     """
+    # Bind the per-process constants (client, model, instructions) once;
+    # each generation call then passes only the fields that vary.
+    _generate = functools.partial(
+        get_or_generate_scout_report,
+        client=client,
+        model=MODEL,
+        scout_instructions=SCOUT_INSTRUCTIONS,
+        use_web=True,
+    )
 
     @app.post("/api/save_suggestion")
     def save_suggestion():
@@ -1037,49 +1277,24 @@ def create_reports_routes(app, require_user_id, client, MODEL, SCOUT_INSTRUCTION
         except (ValueError, TypeError):
             return jsonify({"error": "Invalid report_id"}), 400
         
-        # Fetch the report (from any user, but verify it exists)
-        try:
-            report = get_report(report_id)
-        except Exception:
-            return jsonify({"error": f"Report {report_id} not found"}), 404
-        
-        if not report:
-            return jsonify({"error": f"Report {report_id} not found"}), 404
-        
-        # Extract key fields from the source report
-        player_name = report.get("player_name") or report.get("player") or ""
-        report_md = report.get("report_md", "")
-        payload = report.get("payload", {})
-        
-        # Create a copy for this user without charging credits
+        # Copy the report server-side (from any user) without charging
+        # credits; the payload/report_md blobs never round-trip through
+        # Python. Upsert on (user_id, query_key) keeps repeat saves idempotent.
         try:
-            query_obj = {
-                "player": player_name,
-                "team": (payload.get("team") or "").strip(),
-                "league": (payload.get("league") or "").strip(),
-                "season": (payload.get("season") or "").strip(),
-                "use_web": True,
-            }
-            
-            # Save to this user's library using upsert (won't create duplicate if same query_key)
-            pg_id = insert_report(
-                user_id=user_id,
-                player_name=player_name,
-                query_obj=query_obj,
-                report_md=report_md,
-                payload=payload,
-                cached=True,  # Mark as cached since it came from a suggestion
-            )
-            
-            return jsonify({
-                "success": True,
-                "report_id": pg_id,
-                "message": f"Report saved to your library",
-            })
+            pg_id = insert_report_from_source(report_id, user_id)
         except Exception as e:
             logger.error("Failed to save suggested report: %s", e)
             return jsonify({"error": f"Failed to save report: {str(e)}"}), 500
 
+        if pg_id is None:
+            return jsonify({"error": f"Report {report_id} not found"}), 404
+
+        return jsonify({
+            "success": True,
+            "report_id": pg_id,
+            "message": f"Report saved to your library",
+        })
+
     @app.post("/api/scout")
     def scout():
         """
@@ -1133,9 +1348,14 @@ def create_reports_routes(app, require_user_id, client, MODEL, SCOUT_INSTRUCTION
         use_web = bool(data.get("use_web", True))
         refresh = bool(data.get("refresh", False))
         refresh_stats = bool(data.get("refresh_stats", False))  # User confirmed stats refresh
+        stream = bool(data.get("stream", False))  # Opt-in SSE streaming for generation
 
         logger.info(
-            f"[FLOW] /api/scout start player='{player}' team='{team}' league='{league}' refresh={refresh}"
+            "[FLOW] /api/scout start player='%s' team='%s' league='%s' refresh=%s",
+            player,
+            team,
+            league,
+            refresh,
         )
         report_id_to_update = data.get("report_id")  # For regenerating existing reports
         accept_suggestion = bool(data.get("accept_suggestion", False))  # For accepting suggestions
@@ -1149,14 +1369,14 @@ def create_reports_routes(app, require_user_id, client, MODEL, SCOUT_INSTRUCTION
         if refresh_stats and report_id_to_update and not refresh:
             try:
                 report_id_to_update = int(report_id_to_update)
-                logger.info(f"[FLOW] Fast path: Stats refresh for report_id={report_id_to_update}")
+                logger.info("[FLOW] Fast path: Stats refresh for report_id=%s", report_id_to_update)
                 
                 # Fetch the existing report directly by ID
                 from utils.payload_handler import fetch_report_payload
                 existing_report = fetch_report_payload(user_id, report_id_to_update)
                 
                 if not existing_report:
-                    logger.warning(f"[FLOW] Report {report_id_to_update} not found for user {user_id}")
+                    logger.warning("[FLOW] Report %s not found for user %s", report_id_to_update, user_id)
                     return jsonify({"error": "Report not found"}), 404
                 
                 # Build minimal existing dict for _handle_cached_report
@@ -1175,7 +1395,7 @@ def create_reports_routes(app, require_user_id, client, MODEL, SCOUT_INSTRUCTION
                 return jsonify(result), status_code
                 
             except ValueError:
-                logger.error(f"[FLOW] Invalid report_id: {report_id_to_update}")
+                logger.error("[FLOW] Invalid report_id: %s", report_id_to_update)
                 return jsonify({"error": "Invalid report_id"}), 400
 
         # ========================================================================
@@ -1197,6 +1417,8 @@ def create_reports_routes(app, require_user_id, client, MODEL, SCOUT_INSTRUCTION
         # ========================================================================
         # SECTION 2: CANONICAL NAME NORMALIZATION & LIBRARY CHECK
         # ========================================================================
+        # The library query also fetches the credit balance (seeded into the
+        # per-request cache), so the SECTION 5 pre-check is free.
         existing, canonical_query_player, query_key, query_obj = _check_user_library(
             user_id, player, team, league, season, use_web
         )
@@ -1222,10 +1444,11 @@ def create_reports_routes(app, require_user_id, client, MODEL, SCOUT_INSTRUCTION
         # ========================================================================
         request_id = str(uuid.uuid4())
 
-        # Pre-check balance
+        # Pre-check balance (fetched alongside the SECTION 2 library query)
         try:
-            if get_balance(user_id) < 1:
-                return jsonify({"error": "Insufficient credits. Please top up.", "credits": get_balance(user_id)}), 402
+            balance = _request_balance(user_id)
+            if balance < 1:
+                return jsonify({"error": "Insufficient credits. Please top up.", "credits": balance}), 402
         except Exception:
             return jsonify({"error": "Could not verify credits"}), 500
 
@@ -1236,8 +1459,17 @@ def create_reports_routes(app, require_user_id, client, MODEL, SCOUT_INSTRUCTION
         # ========================================================================
         # SECTION 6: LLM GENERATION
         # ========================================================================
+        # Opt-in streaming: emit SSE deltas while generating, then persist.
+        # Every cache tier above has already missed, so this is the only
+        # section where streaming changes anything.
+        if stream and client is not None:
+            return _stream_generate_and_persist(
+                user_id, client, MODEL, SCOUT_INSTRUCTIONS, player, team, league, season,
+                canonical_query_player, query_obj, refresh, report_id_to_update, request_id,
+            )
+
         payload, status_code = _generate_report_with_llm(
-            user_id, client, MODEL, SCOUT_INSTRUCTIONS, player, team, league, season, refresh
+            user_id, _generate, client, MODEL, player, team, league, season, refresh
         )
         if status_code != 200:
             return jsonify(payload), status_code
@@ -1,12 +1,17 @@
 # services/scout.py
 from __future__ import annotations
 
+import copy
+import functools
 import logging
-from datetime import datetime, timedelta, timezone
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
 from typing import Any, Dict, Optional
 
 from db import PROMPT_VERSION, init_db, make_query_key, find_report_by_query_key, update_report_by_id, spend_credits
 from utils.parse import (
+    extract_canonical_player,
     extract_display_md,
     extract_grades,
     extract_info_fields,
@@ -18,8 +23,72 @@ from utils.stats_refresh import replace_stats_sections
 from utils.prompts import load_text_prompt
 import time
 
+try:
+    from utils.metrics import TimingBatch, increment_metric, record_timing
+except ImportError:
+    TimingBatch = None
+    increment_metric = None
+    record_timing = None
+
+try:
+    from utils.analytics import track_event
+except ImportError:
+    track_event = None
+
 logger = logging.getLogger(__name__)
 
+# Shared generation prompt; built once, substituted per request.
+_USER_PROMPT_TEMPLATE = """Player: {player}
+
+Provided team (may be blank): {team}
+Provided league (may be blank): {league}
+Provided season (may be blank): {season}
+
+Write the scouting report now."""
+
+
+def _build_user_prompt(player: str, team: str, league: str, season: str) -> str:
+    return _USER_PROMPT_TEMPLATE.format(
+        player=player,
+        team=team or "(not provided)",
+        league=league or "(not provided)",
+        season=season or "(not provided)",
+    )
+
+
+def _safe(fn, *args, **kwargs) -> None:
+    """Call a best-effort hook (metrics, analytics), swallowing failures."""
+    if fn is None:
+        return
+    try:
+        fn(*args, **kwargs)
+    except Exception:
+        pass
+
+
+def _batched_timings(fn):
+    """Run fn inside a TimingBatch so its record_timing calls (including
+    those from _parse_and_render_report) flush in one DB round-trip."""
+    if TimingBatch is None:
+        return fn
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        with TimingBatch():
+            return fn(*args, **kwargs)
+
+    return wrapper
+
+
+@functools.lru_cache(maxsize=4096)
+def iso_to_epoch(iso_str: str) -> float:
+    """Epoch seconds for an ISO-8601 timestamp (trailing 'Z' tolerated).
+
+    Staleness checks run on every cache hit and keep seeing the same
+    updated_at string until the row changes, so the parse is memoized.
+    """
+    return datetime.fromisoformat(iso_str.replace("Z", "+00:00")).timestamp()
+
 
 def _build_payload_from_report(
     *,
@@ -33,39 +102,9 @@ def _build_payload_from_report(
     cached: bool,
     created_at: Optional[str] = None,
 ) -> Dict[str, Any]:
-    info_fields = extract_info_fields(report_md)
-    grades, final_verdict = extract_grades(report_md)
-    # Measure parse stages
-    import time
-    try:
-        from utils.metrics import record_timing
-    except Exception:
-        record_timing = None
-
-    t_parse_start = time.time()
-    season_snapshot = extract_season_snapshot(report_md)
-    last3_games = extract_last3_games(report_md)
-    t_parse_ms = (time.time() - t_parse_start) * 1000.0
-    try:
-        if record_timing:
-            try:
-                record_timing("parse_md_ms", t_parse_ms)
-            except Exception:
-                pass
-    except Exception:
-        pass
-
-    t_display_start = time.time()
-    display_md = extract_display_md(report_md)
-    t_display_ms = (time.time() - t_display_start) * 1000.0
-    try:
-        if record_timing:
-            try:
-                record_timing("display_extract_ms", t_display_ms)
-            except Exception:
-                pass
-    except Exception:
-        pass
+    report_html, info_fields, grades, final_verdict, season_snapshot, last3_games = (
+        _parse_and_render_report(report_md)
+    )
 
     payload: Dict[str, Any] = {
         "player": player,
@@ -79,37 +118,156 @@ def _build_payload_from_report(
         # canonical
         "report_md": report_md,
         # display-only (no title/header/grades/sources/tables)
-        "report_html": md_to_safe_html(display_md),
-        # structured for UI
-        "info_fields": info_fields,
-        "grades": grades,
+        "report_html": report_html,
+        # structured for UI (copied: payloads get mutated downstream and
+        # must not write back into the shared cache entry; the extractors
+        # produce flat str->str dicts and lists of flat dicts, so
+        # per-element copies are as safe as deepcopy at a fraction of
+        # the cost)
+        "info_fields": dict(info_fields),
+        "grades": [dict(g) for g in grades],
         "final_verdict": final_verdict,
-        "season_snapshot": season_snapshot,
-        "last3_games": last3_games,
+        "season_snapshot": dict(season_snapshot),
+        "last3_games": [dict(g) for g in last3_games],
     }
-    # Measure HTML rendering cost
+    if created_at:
+        payload["created_at"] = created_at
+    return payload
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_and_render_report(report_md: str):
+    """Parse + render the derived pieces of a report, memoized on content.
+
+    report_md is immutable between refreshes (a refresh writes new
+    markdown, which is a new key, so stale entries simply age out), so
+    repeat cache hits resolve to a dict lookup instead of re-running
+    markdown parsing and HTML sanitization — the hottest steps of the
+    cached path. Timings are only recorded on misses, i.e. when the
+    work actually happens.
+    """
+    t_parse_start = time.time()
+    info_fields = extract_info_fields(report_md)
+    grades, final_verdict = extract_grades(report_md)
+    season_snapshot = extract_season_snapshot(report_md)
+    last3_games = extract_last3_games(report_md)
+    _safe(record_timing, "parse_md_ms", (time.time() - t_parse_start) * 1000.0)
+
+    t_display_start = time.time()
+    display_md = extract_display_md(report_md)
+    _safe(record_timing, "display_extract_ms", (time.time() - t_display_start) * 1000.0)
+
     try:
         t_render_start = time.time()
-        payload["report_html"] = md_to_safe_html(display_md)
-        t_render_ms = (time.time() - t_render_start) * 1000.0
-        if record_timing:
-            try:
-                record_timing("render_html_ms", t_render_ms)
-            except Exception:
-                pass
+        report_html = md_to_safe_html(display_md)
+        _safe(record_timing, "render_html_ms", (time.time() - t_render_start) * 1000.0)
     except Exception:
         # fallback if rendering fails
-        payload["report_html"] = ""
+        report_html = ""
+        _safe(record_timing, "render_html_ms", 0.0)
+
+    return report_html, info_fields, grades, final_verdict, season_snapshot, last3_games
+
+
+# Background pool for stale-stats refreshes: cache hits return the stale
+# report immediately and the refresh lands before the next load. The
+# in-flight set dedupes concurrent requests for the same report.
+_STATS_REFRESH_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="stats-refresh")
+_STATS_REFRESH_INFLIGHT: set = set()
+_STATS_REFRESH_LOCK = threading.Lock()
+
+# Single-flight map for uncached generations: query key -> Future holding
+# the generated payload. Duplicate concurrent requests await the first
+# caller's result instead of issuing their own LLM call.
+_GEN_INFLIGHT: Dict[str, Future] = {}
+_GEN_INFLIGHT_LOCK = threading.Lock()
+
+
+def _refresh_stats_background(
+    user_id: str,
+    cached_id: int,
+    player_name: str,
+    updated_at_str: Optional[str],
+    report_md: str,
+    payload_obj: Dict[str, Any],
+    client,
+    model: str,
+) -> None:
+    """Charge, re-fetch stats via a lightweight LLM call, and update the
+    cached report. Runs on _STATS_REFRESH_POOL; any failure leaves the
+    stale report in place."""
+    try:
+        logger.info(f"Starting stats refresh for {player_name}")
         try:
-            if record_timing:
-                record_timing("render_html_ms", 0.0)
-        except Exception:
+            # Charge 1 credit for stats refresh; if insufficient, keep stale
+            try:
+                spend_credits(
+                    user_id,
+                    1,
+                    reason="stats_refresh",
+                    source_type="stats_refresh",
+                    source_id=f"stats_refresh_{cached_id}_{int(time.time())}",
+                )
+            except ValueError as e:
+                if "INSUFFICIENT_CREDITS" in str(e):
+                    logger.warning("Stats refresh skipped due to insufficient credits")
+                    raise
+                raise
+            except Exception as e:
+                logger.error(f"Failed to charge credit for stats refresh: {e}")
+                raise
+
+            # Load stats-refresh prompt template
+            stats_prompt_template = load_text_prompt("prompts/stats_refresh.txt")
+            stats_user_prompt = stats_prompt_template.format(
+                player_name=player_name,
+                last_updated=updated_at_str or "unknown"
+            )
+
+            logger.info(f"Calling LLM for stats refresh (model={model})")
+            # Call LLM for stats only (much cheaper than full report)
+            tools = [{"type": "web_search"}]
+            stats_resp = client.responses.create(
+                model=model,
+                instructions="",
+                input=stats_user_prompt,
+                tools=tools,
+            )
+            fresh_stats_md = stats_resp.output_text or ""
+            logger.info(f"LLM stats refresh returned {len(fresh_stats_md)} chars")
+
+            # Replace only stats sections in cached report
+            updated_report_md = replace_stats_sections(report_md, fresh_stats_md)
+
+            # Update the cached report with fresh stats
+            if updated_report_md != report_md:
+                logger.info(f"Stats sections changed, updating cache (report_id={cached_id})")
+                try:
+                    update_report_by_id(
+                        user_id=user_id,
+                        report_id=cached_id,
+                        player_name=player_name,
+                        report_md=updated_report_md,
+                        payload=payload_obj,
+                        cached=True,
+                    )
+                    logger.info(f"Cache updated successfully for report_id={cached_id}")
+                except Exception as e:
+                    logger.error(f"Failed to update cache: {e}")
+                    # If update fails, the stale version stays served
+                    pass
+            else:
+                logger.info("Stats sections unchanged after refresh")
+        except Exception as e:
+            logger.error(f"Stats refresh failed: {e}")
+            # If stats refresh fails, the stale version stays served
             pass
-    if created_at:
-        payload["created_at"] = created_at
-    return payload
+    finally:
+        with _STATS_REFRESH_LOCK:
+            _STATS_REFRESH_INFLIGHT.discard(cached_id)
 
 
+@_batched_timings
 def get_or_generate_scout_report(
     *,
     client,
@@ -123,21 +281,23 @@ def get_or_generate_scout_report(
     refresh: bool,
     user_id: str = None,
 ) -> Dict[str, Any]:
-    player = (player or "").strip()
-    team = (team or "").strip()
-    league = (league or "").strip()
-    season = (season or "").strip()
+    player, team, league, season = (
+        (s or "").strip() for s in (player, team, league, season)
+    )
 
-    if not refresh:
-        # Build query key to look up cached report
-        query_obj = {
+    # Canonical key for both the cache lookup and the single-flight map —
+    # computed once, since make_query_key re-canonicalizes on every call.
+    query_key = make_query_key(
+        {
             "player": player,
             "team": team,
             "league": league,
             "season": season,
             "use_web": use_web,
         }
-        query_key = make_query_key(query_obj)
+    )
+
+    if not refresh:
         # Try to find cached report (requires user_id for library lookup)
         if user_id:
             cached_row = find_report_by_query_key(user_id, query_key)
@@ -152,10 +312,9 @@ def get_or_generate_scout_report(
                 needs_stats_refresh = False
                 if updated_at_str:
                     try:
-                        updated_at = datetime.fromisoformat(updated_at_str.replace('Z', '+00:00'))
-                        age = datetime.now(timezone.utc) - updated_at
-                        logger.info(f"Report age: {age.total_seconds():.1f} seconds")
-                        if age > timedelta(hours=24):
+                        age_seconds = time.time() - iso_to_epoch(updated_at_str)
+                        logger.info(f"Report age: {age_seconds:.1f} seconds")
+                        if age_seconds > 86400:  # 24 hours
                             needs_stats_refresh = True
                             logger.info(f"Stats are stale (>24h), triggering refresh")
                         else:
@@ -164,77 +323,31 @@ def get_or_generate_scout_report(
                         logger.warning(f"Failed to parse updated_at: {e}")
                         pass
                 
-                # If stats are stale, refresh them with a lightweight LLM call
+                # If stats are stale, hand the refresh to the background
+                # pool and serve the stale copy immediately — the user
+                # shouldn't wait out an LLM round-trip for a cache hit.
                 if needs_stats_refresh and client and use_web:
-                    logger.info(f"Starting stats refresh for {player}")
-                    try:
-                        # Charge 1 credit for stats refresh; if insufficient, serve stale
-                        try:
-                            spend_credits(
-                                user_id,
-                                1,
-                                reason="stats_refresh",
-                                source_type="stats_refresh",
-                                source_id=f"stats_refresh_{cached_id}_{int(time.time())}",
-                            )
-                        except ValueError as e:
-                            if "INSUFFICIENT_CREDITS" in str(e):
-                                logger.warning("Stats refresh skipped due to insufficient credits")
-                                raise
-                            raise
-                        except Exception as e:
-                            logger.error(f"Failed to charge credit for stats refresh: {e}")
-                            raise
-
-                        # Load stats-refresh prompt template
-                        stats_prompt_template = load_text_prompt("prompts/stats_refresh.txt")
-                        stats_user_prompt = stats_prompt_template.format(
-                            player_name=cached_row.get("player_name") or player,
-                            last_updated=updated_at_str or "unknown"
+                    scheduled = False
+                    with _STATS_REFRESH_LOCK:
+                        if cached_id not in _STATS_REFRESH_INFLIGHT:
+                            _STATS_REFRESH_INFLIGHT.add(cached_id)
+                            scheduled = True
+                    if scheduled:
+                        logger.info(f"Scheduling background stats refresh for {player}")
+                        _STATS_REFRESH_POOL.submit(
+                            _refresh_stats_background,
+                            user_id,
+                            cached_id,
+                            cached_row.get("player_name") or player,
+                            updated_at_str,
+                            report_md,
+                            cached_row.get("payload") or {},
+                            client,
+                            model,
                         )
-                        
-                        logger.info(f"Calling LLM for stats refresh (model={model})")
-                        # Call LLM for stats only (much cheaper than full report)
-                        tools = [{"type": "web_search"}]
-                        stats_resp = client.responses.create(
-                            model=model,
-                            instructions="",
-                            input=stats_user_prompt,
-                            tools=tools,
-                        )
-                        fresh_stats_md = stats_resp.output_text or ""
-                        logger.info(f"LLM stats refresh returned {len(fresh_stats_md)} chars")
-                        
-                        # Replace only stats sections in cached report
-                        updated_report_md = replace_stats_sections(report_md, fresh_stats_md)
-                        
-                        # Update the cached report with fresh stats
-                        if updated_report_md != report_md:
-                            logger.info(f"Stats sections changed, updating cache (report_id={cached_id})")
-                            try:
-                                # Rebuild payload from the original cached_row
-                                payload_obj = cached_row.get("payload") or {}
-                                update_report_by_id(
-                                    user_id=user_id,
-                                    report_id=cached_id,
-                                    player_name=cached_row.get("player_name") or player,
-                                    report_md=updated_report_md,
-                                    payload=payload_obj,
-                                    cached=True,
-                                )
-                                report_md = updated_report_md
-                                logger.info(f"Cache updated successfully for report_id={cached_id}")
-                            except Exception as e:
-                                logger.error(f"Failed to update cache: {e}")
-                                # If update fails, serve stale version
-                                pass
-                        else:
-                            logger.info("Stats sections unchanged after refresh")
-                    except Exception as e:
-                        logger.error(f"Stats refresh failed: {e}")
-                        # If stats refresh fails, serve stale version
-                        pass
-                
+                    else:
+                        logger.info(f"Stats refresh already in flight (report_id={cached_id})")
+
                 payload = _build_payload_from_report(
                     report_md=report_md,
                     player=cached_row.get("player_name") or player,
@@ -246,29 +359,79 @@ def get_or_generate_scout_report(
                     cached=True,
                     created_at=cached_row.get("created_at"),
                 )
-                # Mark if stats were just refreshed
+                # Mark that a refresh is running; the next load sees fresh stats
                 if needs_stats_refresh:
-                    payload["stats_refreshed"] = True
+                    payload["stats_refreshed"] = False
+                    payload["stats_refreshing"] = True
                 return payload
 
-    user_prompt = f"""
-Player: {player}
+    # Single-flight: concurrent requests for the same uncached query share
+    # one LLM call instead of issuing N identical ones. Forced refreshes
+    # bypass the dedupe — they explicitly ask for a fresh generation.
+    if not refresh:
+        gen_key = query_key
+        with _GEN_INFLIGHT_LOCK:
+            fut = _GEN_INFLIGHT.get(gen_key)
+            owner = fut is None
+            if owner:
+                fut = Future()
+                _GEN_INFLIGHT[gen_key] = fut
+        if not owner:
+            logger.info(f"Joining in-flight generation for {player}")
+            # Each caller persists/mutates its own payload downstream
+            return copy.deepcopy(fut.result())
+        try:
+            payload = _generate_uncached(
+                client=client,
+                model=model,
+                scout_instructions=scout_instructions,
+                player=player,
+                team=team,
+                league=league,
+                season=season,
+                use_web=use_web,
+                user_id=user_id,
+            )
+            fut.set_result(payload)
+            return payload
+        except BaseException as e:
+            fut.set_exception(e)
+            raise
+        finally:
+            with _GEN_INFLIGHT_LOCK:
+                _GEN_INFLIGHT.pop(gen_key, None)
 
-Provided team (may be blank): {team if team else "(not provided)"}
-Provided league (may be blank): {league if league else "(not provided)"}
-Provided season (may be blank): {season if season else "(not provided)"}
+    return _generate_uncached(
+        client=client,
+        model=model,
+        scout_instructions=scout_instructions,
+        player=player,
+        team=team,
+        league=league,
+        season=season,
+        use_web=use_web,
+        user_id=user_id,
+    )
 
-Write the scouting report now.
-""".strip()
 
-    tools = [{"type": "web_search"}] if use_web else []
+def _generate_uncached(
+    *,
+    client,
+    model: str,
+    scout_instructions: str,
+    player: str,
+    team: str,
+    league: str,
+    season: str,
+    use_web: bool,
+    user_id: str = None,
+) -> Dict[str, Any]:
+    """Blocking LLM generation + payload build (no cache lookup)."""
+    user_prompt = _build_user_prompt(player, team, league, season)
 
-    from utils.metrics import increment_metric
+    tools = [{"type": "web_search"}] if use_web else []
 
-    try:
-        increment_metric("llm_calls")
-    except Exception:
-        pass
+    _safe(increment_metric, "llm_calls")
     # Measure LLM response time and overall scout pipeline time
     pipeline_start = time.time()
     resp_start = time.time()
@@ -278,57 +441,36 @@ Write the scouting report now.
         input=user_prompt,
         tools=tools,
     )
-    resp_elapsed_ms = (time.time() - resp_start) * 1000.0
-    try:
-        from utils.metrics import record_timing
-
-        try:
-            record_timing("llm_response_ms", resp_elapsed_ms)
-        except Exception:
-            pass
-    except Exception:
-        pass
+    _safe(record_timing, "llm_response_ms", (time.time() - resp_start) * 1000.0)
     report_md = resp.output_text or ""
     
-    # Capture usage information from the API response
-    usage_data = {}
-    try:
-        if hasattr(resp, 'usage') and resp.usage:
-            usage_data = {
-                "input_tokens": getattr(resp.usage, 'input_tokens', 0),
-                "output_tokens": getattr(resp.usage, 'output_tokens', 0),
-            }
-    except Exception:
-        pass
-
+    # Capture usage information from the API response; the SDK object
+    # shape is stable, so access directly and treat any miss as "no usage"
     try:
-        # count generated-success events when model returns non-empty output
-        if report_md and len(report_md) > 0:
-            try:
-                increment_metric("llm_success")
-            except Exception:
-                pass
-            try:
-                # Track generation event
-                from utils.analytics import track_event
+        usage_data = {
+            "input_tokens": resp.usage.input_tokens,
+            "output_tokens": resp.usage.output_tokens,
+        }
+    except AttributeError:
+        usage_data = {}
 
-                track_event(
-                    user_id,
-                    "report_generated",
-                    {
-                        "player": player,
-                        "team": team,
-                        "league": league,
-                        "season": season,
-                        "use_web": bool(use_web),
-                        "cached": False,
-                        "model": model,
-                    },
-                )
-            except Exception:
-                pass
-    except Exception:
-        pass
+    # count generated-success events when model returns non-empty output
+    if report_md:
+        _safe(increment_metric, "llm_success")
+        _safe(
+            track_event,
+            user_id,
+            "report_generated",
+            {
+                "player": player,
+                "team": team,
+                "league": league,
+                "season": season,
+                "use_web": bool(use_web),
+                "cached": False,
+                "model": model,
+            },
+        )
 
     # Do not persist sentinel responses where the model explicitly says the
     # player could not be verified. Persistence is handled by the caller
@@ -341,20 +483,10 @@ Write the scouting report now.
     # subsequent fuzzy lookups use the correct canonical form rather than
     # the user's typed variant.
     # Derive canonical player name for the returned payload (best-effort)
-    from utils.parse import extract_canonical_player
-
     canonical_player = extract_canonical_player(report_md) or ""
-    pipeline_elapsed_ms = (time.time() - pipeline_start) * 1000.0
-    try:
-        from utils.metrics import record_timing
+    _safe(record_timing, "scout_pipeline_ms", (time.time() - pipeline_start) * 1000.0)
+
 
-        try:
-            record_timing("scout_pipeline_ms", pipeline_elapsed_ms)
-        except Exception:
-            pass
-    except Exception:
-        pass
-    
     # Build payload and include usage data
     payload = _build_payload_from_report(
         report_md=report_md,
@@ -370,5 +502,117 @@ Write the scouting report now.
     # Add usage data to the payload for cost tracking
     if usage_data:
         payload["usage"] = usage_data
-    
+
     return payload
+
+
+def stream_scout_report(
+    *,
+    client,
+    model: str,
+    scout_instructions: str,
+    player: str,
+    team: str,
+    league: str,
+    season: str,
+    use_web: bool = True,
+    user_id: str = None,
+):
+    """
+    Streaming variant of the generation path of get_or_generate_scout_report.
+
+    Yields ("delta", text) for each output-text chunk as it arrives from
+    the Responses API, a one-time ("meta", dict) with the header info
+    fields as soon as the report header has fully streamed (so the UI can
+    render player/team/league while the body is still generating), then a
+    final ("payload", dict) built the same way as the blocking path
+    (canonical name, usage data, metrics). No cache lookup happens here —
+    callers stream only after every cache tier has already missed.
+    """
+    player, team, league, season = (
+        (s or "").strip() for s in (player, team, league, season)
+    )
+
+    user_prompt = _build_user_prompt(player, team, league, season)
+
+    tools = [{"type": "web_search"}] if use_web else []
+
+    _safe(increment_metric, "llm_calls")
+
+    resp_start = time.time()
+    report_md = ""
+    final_resp = None
+    meta_sent = False
+    with client.responses.stream(
+        model=model,
+        instructions=scout_instructions,
+        input=user_prompt,
+        tools=tools,
+    ) as stream:
+        for event in stream:
+            if getattr(event, "type", "") == "response.output_text.delta":
+                delta = getattr(event, "delta", "") or ""
+                if delta:
+                    report_md += delta
+                    yield ("delta", delta)
+                    # The header (bold **Field:** lines) ends at the first
+                    # "### " section; once that boundary streams past, the
+                    # info fields are complete and can be parsed and shown
+                    # while the rest of the report is still generating.
+                    if not meta_sent and "\n### " in report_md:
+                        meta_sent = True
+                        try:
+                            info_fields = extract_info_fields(report_md)
+                            if info_fields:
+                                yield ("meta", {"info_fields": info_fields})
+                        except Exception:
+                            pass
+        final_resp = stream.get_final_response()
+
+    _safe(record_timing, "llm_response_ms", (time.time() - resp_start) * 1000.0)
+
+    if final_resp is not None:
+        report_md = final_resp.output_text or report_md
+
+    try:
+        usage_data = {
+            "input_tokens": final_resp.usage.input_tokens,
+            "output_tokens": final_resp.usage.output_tokens,
+        }
+    except AttributeError:
+        usage_data = {}
+
+    if report_md:
+        _safe(increment_metric, "llm_success")
+        _safe(
+            track_event,
+            user_id,
+            "report_generated",
+            {
+                "player": player,
+                "team": team,
+                "league": league,
+                "season": season,
+                "use_web": bool(use_web),
+                "cached": False,
+                "model": model,
+            },
+        )
+
+    canonical_player = extract_canonical_player(report_md) or ""
+
+    payload = _build_payload_from_report(
+        report_md=report_md,
+        player=canonical_player if canonical_player else player,
+        team=team,
+        league=league,
+        season=season,
+        model=model,
+        use_web=use_web,
+        cached=False,
+    )
+
+    if usage_data:
+        payload["usage"] = usage_data
+
+    yield ("payload", payload)
@@ -7,10 +7,24 @@ are best-effort and never fail the application.
 
 import logging
 import os
+import queue
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
+# Bound once: logging.getLogger locks and walks the hierarchy per call.
+_ANALYTICS_LOGGER = logging.getLogger("hoopscout.analytics")
+
 # --- Analytics Client (optional) ---
+_POSTHOG_API_KEY = os.getenv("POSTHOG_API_KEY")
+_POSTHOG_HOST = os.getenv("POSTHOG_HOST") or "https://app.posthog.com"
+
+try:
+    import posthog as _posthog_module
+except Exception:
+    _posthog_module = None
+
 try:
     try:
         # Newer SDKs expose Client; alias it to Posthog for compatibility
@@ -19,10 +33,19 @@ try:
         # Older SDKs expose Posthog directly
         from posthog import Posthog  # type: ignore
 
-    _POSTHOG_API_KEY = os.getenv("POSTHOG_API_KEY")
-    _POSTHOG_HOST = os.getenv("POSTHOG_HOST") or "https://app.posthog.com"
     if _POSTHOG_API_KEY and Posthog:
-        _analytics_client = Posthog(project_api_key=_POSTHOG_API_KEY, host=_POSTHOG_HOST)
+        try:
+            # Size/interval batching inside the SDK: ship every 50 events
+            # or 2 s, whichever comes first.
+            _analytics_client = Posthog(
+                project_api_key=_POSTHOG_API_KEY,
+                host=_POSTHOG_HOST,
+                flush_at=50,
+                flush_interval=2.0,
+            )
+        except TypeError:
+            # Older SDKs without the batching kwargs
+            _analytics_client = Posthog(project_api_key=_POSTHOG_API_KEY, host=_POSTHOG_HOST)
         try:
             logging.getLogger("posthog").info("PostHog analytics initialized")
         except Exception:
@@ -33,60 +56,86 @@ except Exception:
     _analytics_client = None
 
 
+# In-process event queue drained by a single daemon thread so track_event
+# is a bounded O(1) enqueue on the request path — the PostHog SDK's
+# capture() can block on its own queue/transport, and the old
+# POSTHOG_IMMEDIATE_FLUSH branch paid a TLS handshake per event.
+_EVENT_QUEUE: queue.Queue = queue.Queue(maxsize=10000)
+_DRAIN_BATCH = 100
+_DRAIN_INTERVAL_S = 0.5
+# Push each drained batch out of the SDK's buffer right away instead of
+# waiting for its own flush interval — the low-latency replacement for
+# the old per-event short-lived-client flush.
+_IMMEDIATE_FLUSH = os.getenv("POSTHOG_IMMEDIATE_FLUSH") == "1"
+_dropped_events = 0
+_drain_thread: threading.Thread | None = None
+_drain_thread_lock = threading.Lock()
+
+
+def _capture(distinct_id: str | None, event: str, properties: dict) -> None:
+    """Deliver one event to the pooled client. Runs on the drain thread."""
+    log = _ANALYTICS_LOGGER
+    try:
+        _analytics_client.capture(distinct_id=distinct_id or "anonymous", event=event, properties=properties)
+    except TypeError:
+        try:
+            _posthog_module.capture(distinct_id or "anonymous", event, properties=properties)
+        except Exception as e:
+            log.exception("Fallback posthog.capture failed: %s", e)
+    except Exception as e:
+        log.exception("Error sending analytics event: %s", e)
+
+
+def _drain() -> None:
+    """Consume queued events in batches of up to _DRAIN_BATCH per interval."""
+    while True:
+        items = [_EVENT_QUEUE.get()]
+        deadline = time.monotonic() + _DRAIN_INTERVAL_S
+        while len(items) < _DRAIN_BATCH:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                items.append(_EVENT_QUEUE.get(timeout=timeout))
+            except queue.Empty:
+                break
+        for distinct_id, event, properties in items:
+            _capture(distinct_id, event, properties)
+        if _IMMEDIATE_FLUSH:
+            try:
+                if hasattr(_analytics_client, "flush"):
+                    _analytics_client.flush()
+            except Exception:
+                pass
+
+
+def _ensure_drain_thread() -> None:
+    global _drain_thread
+    if _drain_thread is not None and _drain_thread.is_alive():
+        return
+    with _drain_thread_lock:
+        if _drain_thread is None or not _drain_thread.is_alive():
+            _drain_thread = threading.Thread(target=_drain, name="analytics-drain", daemon=True)
+            _drain_thread.start()
+
+
 def track_event(distinct_id: str | None, event: str, properties: dict | None = None) -> None:
-    """Safely send an event to PostHog if configured. No-op when unavailable.
+    """Safely queue an event for PostHog if configured. No-op when unavailable.
 
-    `distinct_id` may be `None` for anonymous events.
+    `distinct_id` may be `None` for anonymous events. Never blocks: if the
+    queue is full the event is dropped and counted.
     """
-    logger = logging.getLogger("hoopscout.analytics")
+    global _dropped_events
     try:
         if not _analytics_client:
-            logger.info("analytics disabled - dropping event %s", event)
             return
-
-        immediate = os.getenv("POSTHOG_IMMEDIATE_FLUSH") == "1"
-
-        if immediate:
-            # Use a fresh short-lived client so we can flush immediately without
-            # affecting the global client state.
-            try:
-                from posthog import Client as PH
-
-                ph = PH(project_api_key=os.getenv("POSTHOG_API_KEY"), host=os.getenv("POSTHOG_HOST") or "https://app.posthog.com")
-                try:
-                    ph.capture(distinct_id=distinct_id or "anonymous", event=event, properties=properties or {})
-                except TypeError:
-                    import posthog as ph_mod
-
-                    ph_mod.capture(distinct_id or "anonymous", event, properties=properties or {})
-                try:
-                    ph.shutdown()
-                except Exception:
-                    pass
-                logger.info("event flushed immediately: %s with properties: %s", event, properties or {})
-                return
-            except Exception as e:
-                logger.exception("Immediate flush failed, falling back to pooled client: %s", e)
-
-        # Normal path: use pooled client
-        logger.info("tracking event %s for %s: %s", event, distinct_id or "anonymous", properties or {})
+        _ensure_drain_thread()
         try:
-            _analytics_client.capture(distinct_id=distinct_id or "anonymous", event=event, properties=properties or {})
-            logger.info("event queued (client.capture): %s", event)
-            return
-        except TypeError:
-            try:
-                import posthog as posthog_module
-
-                logger.info("falling back to module-level posthog.capture for event %s", event)
-                posthog_module.capture(distinct_id or "anonymous", event, properties=properties or {})
-                logger.info("event queued (module.capture): %s", event)
-                return
-            except Exception as e2:
-                logger.exception("Fallback posthog.capture failed: %s", e2)
-                return
+            _EVENT_QUEUE.put_nowait((distinct_id, event, properties or {}))
+        except queue.Full:
+            _dropped_events += 1
     except Exception as e:
-        logger.exception("Error sending analytics event: %s", e)
+        _ANALYTICS_LOGGER.exception("Error queueing analytics event: %s", e)
         # Do not allow analytics failures to affect app behavior
         return
 
@@ -96,7 +145,7 @@ def alias_user(previous_id: str, distinct_id: str) -> None:
     
     Automatically merges all events from previous_id into distinct_id's profile.
     """
-    logger = logging.getLogger("hoopscout.analytics")
+    logger = _ANALYTICS_LOGGER
     try:
         if not _analytics_client:
             logger.info("analytics disabled - skipping alias")
@@ -112,23 +161,44 @@ def alias_user(previous_id: str, distinct_id: str) -> None:
         logger.exception("Error aliasing user: %s", e)
 
 
+def flush_now() -> None:
+    """Synchronously deliver everything queued, then flush the SDK buffer.
+
+    The escape hatch for callers that need immediate delivery (shutdown,
+    dev tooling) without reintroducing per-event flushing on the request
+    path.
+    """
+    if not _analytics_client:
+        return
+    try:
+        while True:
+            distinct_id, event, properties = _EVENT_QUEUE.get_nowait()
+            _capture(distinct_id, event, properties)
+    except queue.Empty:
+        pass
+    try:
+        if hasattr(_analytics_client, "flush"):
+            _analytics_client.flush()
+    except Exception:
+        pass
+
+
 def shutdown_analytics() -> None:
     """Flush and shutdown the PostHog analytics client on app exit.
-    
+
     Critical for Render's ephemeral dynos to ensure queued events aren't lost on restart.
     """
     try:
         if _analytics_client:
-            # Flush any pending events before shutdown
-            if hasattr(_analytics_client, "flush"):
-                _analytics_client.flush()
+            # Deliver anything still queued in-process, flush the SDK
+            flush_now()
             # Then shutdown the client
             if hasattr(_analytics_client, "shutdown"):
                 _analytics_client.shutdown()
-            logger = logging.getLogger("hoopscout.analytics")
+            logger = _ANALYTICS_LOGGER
             logger.info("PostHog analytics flushed and shutdown on exit")
     except Exception as e:
-        logger = logging.getLogger("hoopscout.analytics")
+        logger = _ANALYTICS_LOGGER
         logger.exception("Error during analytics shutdown: %s", e)
 
 
@@ -137,8 +207,8 @@ def analytics_enabled() -> dict:
     try:
         return {
             "enabled": bool(_analytics_client),
-            "host": os.getenv("POSTHOG_HOST") or "https://app.posthog.com",
-            "has_key": bool(os.getenv("POSTHOG_API_KEY")),
+            "host": _POSTHOG_HOST,
+            "has_key": bool(_POSTHOG_API_KEY),
         }
     except Exception:
         return {"enabled": False, "host": None, "has_key": False}
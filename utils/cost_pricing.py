@@ -4,6 +4,7 @@ Provides pricing information for various AI models and calculates
 estimated costs based on token consumption.
 """
 
+import functools
 import logging
 
 logger = logging.getLogger(__name__)
@@ -55,12 +56,16 @@ MODEL_PRICES = {
 }
 
 
+@functools.lru_cache(maxsize=32)
 def get_model_prices(model: str) -> dict:
     """Get pricing for a specific model.
-    
+
+    The model name is fixed per process, so the substring scan over
+    MODEL_PRICES runs once and repeat lookups are a cache probe.
+
     Args:
         model: Model name
-        
+
     Returns:
         Dict with 'input' and 'output' pricing per 1M tokens
     """
@@ -170,6 +170,40 @@ def cosine(a, b):
     return float(np.dot(a, b) / denom)
 
 
+# Row-normalized embedding matrices grouped by dimension (OpenAI and the
+# local encoder produce different widths), derived from the TTL cache in
+# load_all_embeddings and rebuilt only when that cache refreshes.
+_MATRIX_CACHE = {"ts": None, "groups": None}
+
+
+def _embedding_matrix_groups(rows):
+    """Return {dim: (report_ids, unit_matrix)} built from (rid, vec) rows."""
+    cache_ts = _EMBED_CACHE.get("ts")
+    if _MATRIX_CACHE["ts"] == cache_ts and _MATRIX_CACHE["groups"] is not None:
+        return _MATRIX_CACHE["groups"]
+
+    by_dim = {}
+    for rid, vec in rows:
+        try:
+            by_dim.setdefault(len(vec), []).append((int(rid), vec))
+        except Exception:
+            continue
+
+    groups = {}
+    for dim, items in by_dim.items():
+        ids = np.array([rid for rid, _ in items], dtype=np.int64)
+        # float32 halves the bytes the matvec streams per query; unit
+        # vectors lose ~1e-7 per component, far below ranking resolution.
+        mat = np.array([vec for _, vec in items], dtype=np.float32)
+        norms = np.linalg.norm(mat, axis=1)
+        norms[norms == 0] = 1.0
+        groups[dim] = (ids, mat / norms[:, None])
+
+    _MATRIX_CACHE["ts"] = cache_ts
+    _MATRIX_CACHE["groups"] = groups
+    return groups
+
+
 def find_nearest(client, text: str, top_k: int = 3):
     """Compute embedding for `text` and return top_k (report_id, score) tuples sorted desc."""
     # Get or compute query embedding and cache it in DB to avoid re-encoding
@@ -185,6 +219,28 @@ def find_nearest(client, text: str, top_k: int = 3):
         except Exception:
             pass
     rows = load_all_embeddings()
+
+    if _HAS_NUMPY and rows:
+        # Single matrix-vector product against the pre-normalized matrix
+        # instead of a per-row Python cosine loop.
+        try:
+            groups = _embedding_matrix_groups(rows)
+            ids_mat = groups.get(len(emb))
+            if ids_mat is None:
+                return []
+            ids, mat = ids_mat
+            q = np.asarray(emb, dtype=np.float32)
+            qn = np.linalg.norm(q)
+            if qn == 0:
+                return []
+            scores = mat @ (q / qn)
+            k = min(int(top_k), scores.shape[0])
+            top = np.argpartition(scores, -k)[-k:]
+            top = top[np.argsort(scores[top])[::-1]]
+            return [(int(ids[i]), float(scores[i])) for i in top]
+        except Exception:
+            pass
+
     scored = []
     for rid, vec in rows:
         try:
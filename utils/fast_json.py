@@ -0,0 +1,32 @@
+# utils/fast_json.py
+"""JSON helpers backed by `orjson` when available.
+
+Report payloads are large JSONB blobs (embedded markdown/HTML), so the
+stdlib `json` round-trip shows up on the cached-report paths. `orjson`
+parses/serializes in native code and handles datetimes directly; when it
+is not installed we fall back to stdlib `json` with equivalent options.
+"""
+
+import json
+
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except Exception:
+    orjson = None
+    _HAS_ORJSON = False
+
+
+def json_loads(data):
+    """Parse a JSON document from `str` or `bytes`."""
+    if _HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj, *, default=str) -> str:
+    """Serialize `obj` to a JSON string (non-ASCII preserved)."""
+    if _HAS_ORJSON:
+        return orjson.dumps(obj, default=default).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, default=default)
@@ -1,21 +1,71 @@
 """
 Metrics and timing utilities - now using PostgreSQL instead of SQLite
 """
+import threading
+
 from db import (
     increment_metric,
     get_metric,
     list_metrics,
-    record_timing,
+    record_timings,
     get_timing,
     list_timings,
 )
+from db import record_timing as _record_timing_now
 
 __all__ = [
     "increment_metric",
     "get_metric",
     "list_metrics",
     "record_timing",
+    "record_timings",
+    "TimingBatch",
     "get_timing",
     "list_timings",
 ]
 
+# Active per-thread timing batch; record_timing defers to it when set so
+# a request's timings flush in one DB round-trip instead of one each.
+_ACTIVE_BATCH = threading.local()
+
+
+def record_timing(name: str, ms: float) -> None:
+    """Record a timing measurement.
+
+    Inside a TimingBatch on this thread, the sample is buffered and
+    flushed with the batch; otherwise it is written immediately.
+    """
+    samples = getattr(_ACTIVE_BATCH, "samples", None)
+    if samples is not None:
+        samples.append((name, ms))
+        return
+    _record_timing_now(name, ms)
+
+
+class TimingBatch:
+    """Buffer record_timing calls on this thread; flush once on exit.
+
+    Nested batches buffer into the innermost one. A failed flush is
+    swallowed — metrics must never fail the request.
+    """
+
+    def __enter__(self) -> "TimingBatch":
+        self._prev = getattr(_ACTIVE_BATCH, "samples", None)
+        _ACTIVE_BATCH.samples = []
+        return self
+
+    def record(self, name: str, ms: float) -> None:
+        _ACTIVE_BATCH.samples.append((name, ms))
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        samples = _ACTIVE_BATCH.samples
+        _ACTIVE_BATCH.samples = self._prev
+        if samples:
+            try:
+                if self._prev is not None:
+                    self._prev.extend(samples)
+                else:
+                    record_timings(samples)
+            except Exception:
+                pass
+        return False
@@ -1,24 +1,41 @@
 """Clean name matching for player deduplication."""
 
+import functools
 import logging
 import os
-from difflib import SequenceMatcher
+import unicodedata
 
+# Token-set scorer bound once at import so per-call sites carry no
+# availability checks. rapidfuzz is pinned in requirements.txt; difflib
+# is only imported at all when its wheels are missing.
 try:
-    from rapidfuzz import fuzz
-    _token_sort_ratio = getattr(fuzz, "token_sort_ratio", None)
-    _token_set_ratio = getattr(fuzz, "token_set_ratio", None)
-    if _token_sort_ratio is None:
-        from rapidfuzz.fuzz import token_sort_ratio as _token_sort_ratio
-    if _token_set_ratio is None:
-        from rapidfuzz.fuzz import token_set_ratio as _token_set_ratio
-    _HAS_RAPIDFUZZ = True
+    from rapidfuzz.fuzz import ratio as _plain_ratio
+    from rapidfuzz.fuzz import token_set_ratio as _token_set_ratio
+
+    def _ratio(a: str, b: str) -> int:
+        return int(_token_set_ratio(a, b) or 0)
+
+    # Single-token inputs (first names, surnames) skip the tokenize +
+    # set-ops machinery: plain ratio scores them identically for less
+    # work per call.
+    def _single_ratio(a: str, b: str) -> int:
+        return int(_plain_ratio(a, b) or 0)
 except Exception:
-    _token_sort_ratio = None
+    from difflib import SequenceMatcher
+
     _token_set_ratio = None
-    _HAS_RAPIDFUZZ = False
 
-from utils.normalize import normalize_name
+    def _ratio(a: str, b: str) -> int:
+        return int(SequenceMatcher(None, a, b).ratio() * 100)
+
+    _single_ratio = _ratio
+
+try:
+    from rapidfuzz.distance import JaroWinkler as _JaroWinkler
+except Exception:
+    _JaroWinkler = None
+
+from utils.normalize import normalize_name, normalize_name_cached
 from utils.phonetic import phonetic_key
 from utils.name_variants import NICKNAME_MAP
 
@@ -30,12 +47,40 @@ FIRSTNAME_SECONDARY = int(os.getenv("FIRSTNAME_SECONDARY", "70"))
 LASTNAME_HIGH = int(os.getenv("LASTNAME_HIGH", "95"))
 
 
+@functools.lru_cache(maxsize=16384)
+def _strip_diacritics(s: str) -> str:
+    """Lowercased `s` with combining marks removed.
+
+    Memoized: surname sets repeat across candidate scans, and the NFD
+    pass allocates a fresh string per call otherwise.
+    """
+    return "".join(
+        c for c in unicodedata.normalize("NFD", s) if unicodedata.category(c) != "Mn"
+    ).lower()
+
+
 def _sim_ratio(a: str, b: str) -> int:
-    """Return similarity score 0-100."""
+    """Return similarity score 0-100. Callers pass single name parts."""
     try:
-        if _HAS_RAPIDFUZZ and _token_set_ratio is not None:
-            return int(_token_set_ratio(a, b) or 0)
-        return int(SequenceMatcher(None, a, b).ratio() * 100)
+        if a == b:
+            return 100
+        if not a or not b:
+            return 0
+        return _single_ratio(a, b)
+    except Exception:
+        return 0
+
+
+def _jaro_winkler_ratio(a: str, b: str) -> int:
+    """Jaro-Winkler similarity 0-100; 0 when rapidfuzz is unavailable.
+
+    Better suited than token ratios for single-token surnames, where a
+    shared prefix should count for more than shared character multiset.
+    """
+    if _JaroWinkler is None or not a or not b:
+        return 0
+    try:
+        return int(_JaroWinkler.normalized_similarity(a, b) * 100)
     except Exception:
         return 0
 
@@ -60,26 +105,31 @@ def _check_first_name_alignment(
     candidate_name: str,
     primary_score: int,
     primary_threshold: int = LASTNAME_HIGH,
+    candidate_norm: str | None = None,
 ) -> bool:
     """Check if first names align sufficiently for matching.
-    
+
     Validates that first names are similar enough to accept a match,
     accounting for nicknames and fuzzy matching. Used as a safety check
     to prevent surname-only false matches (e.g., two different players
     with the same last name).
-    
+
     Args:
         player_norm: Normalized query player name
         candidate_name: Candidate player name from database
         primary_score: Main similarity score (embedding or fuzzy)
         primary_threshold: Threshold above which secondary fname requirement applies
-        
+        candidate_norm: Pre-normalized candidate name, when the caller
+            already derived it — skips re-normalizing here
+
     Returns:
         True if first names align sufficiently, False otherwise
     """
     try:
         pn_parts = player_norm.split()
-        nn_parts = normalize_name(candidate_name, transliterate=True).split()
+        if candidate_norm is None:
+            candidate_norm = normalize_name_cached(candidate_name, transliterate=True)
+        nn_parts = candidate_norm.split()
         
         if not pn_parts or not nn_parts:
             return False
@@ -127,12 +177,11 @@ def _last_names_align(a_norm: str, b_norm: str) -> bool:
             return False
         if a_last == b_last:
             return True
-        # Normalize both for diacritic/case comparison
+        # Normalize both for diacritic/case comparison; the stripping is
+        # memoized so the query-side surname pays the NFD pass once per
+        # scan, not once per candidate.
         try:
-            import unicodedata
-            a_clean = ''.join(c for c in unicodedata.normalize('NFD', a_last) if unicodedata.category(c) != 'Mn').lower()
-            b_clean = ''.join(c for c in unicodedata.normalize('NFD', b_last) if unicodedata.category(c) != 'Mn').lower()
-            if a_clean == b_clean:
+            if _strip_diacritics(a_last) == _strip_diacritics(b_last):
                 return True
         except Exception:
             pass
@@ -146,14 +195,15 @@ def _last_names_align(a_norm: str, b_norm: str) -> bool:
         # Fuzzy match for typos: allow if similarity >= 80% and length difference <= 2
         # Lowered from 85% to catch common single-char typos (e.g., "donic" vs "doncic" = 83%)
         try:
-            if _HAS_RAPIDFUZZ and _token_set_ratio is not None:
-                sim = int(_token_set_ratio(a_last.lower(), b_last.lower()) or 0)
-            else:
-                sim = int(SequenceMatcher(None, a_last.lower(), b_last.lower()).ratio() * 100)
-            
+            sim = _single_ratio(a_last.lower(), b_last.lower())
+
             len_diff = abs(len(a_last) - len(b_last))
             if sim >= 80 and len_diff <= 2:
                 return True
+            # Jaro-Winkler catches prefix-preserving typos that token
+            # ratios under-score on single-token surnames.
+            if len_diff <= 2 and _jaro_winkler_ratio(a_last.lower(), b_last.lower()) >= 90:
+                return True
         except Exception:
             pass
     except Exception:
@@ -182,7 +232,7 @@ def names_match(name1: str, name2: str, threshold: int = 85) -> bool:
         return False
 
     def _canon(n: str) -> str:
-        norm = normalize_name(n, transliterate=True)
+        norm = normalize_name_cached(n, transliterate=True)
         parts = [p for p in norm.split() if p]
         # Apply nickname canonicalization to first name
         if parts:
@@ -210,6 +260,8 @@ def names_match(name1: str, name2: str, threshold: int = 85) -> bool:
         try:
             if phonetic_key(last1) == phonetic_key(last2):
                 last_score = 90
+            elif _jaro_winkler_ratio(last1, last2) >= 90:
+                last_score = 90
             else:
                 return False
         except Exception:
@@ -10,6 +10,8 @@ All keys and values should be lowercase.
 Add new variants as you discover them in real usage.
 """
 
+import sys
+
 NICKNAME_MAP = {
     # Greek nicknames (various spellings and transliterations)
     "kostas": "konstantinos",
@@ -56,3 +58,8 @@ NICKNAME_MAP = {
     # Add more variants here as needed:
     # "nickname": "full_name",
 }
+
+# Intern keys and values once: lookups against the map happen per
+# candidate in the matching hot loops, and interning makes the hash and
+# equality checks on these short strings as cheap as pointer compares.
+NICKNAME_MAP = {sys.intern(k): sys.intern(v) for k, v in NICKNAME_MAP.items()}
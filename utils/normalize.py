@@ -1,3 +1,4 @@
+import functools
 import re
 import unicodedata
 
@@ -9,6 +10,10 @@ except Exception:
     unidecode = None
     _HAS_UNIDECODE = False
 
+# Strings already in normalized form (lowercase ASCII words separated by
+# single spaces) are fixed points of normalize_name — return them as-is.
+_ALREADY_NORMALIZED_RE = re.compile(r"[a-z0-9_]+(?: [a-z0-9_]+)*\Z")
+
 
 def normalize_name(s: str, transliterate: bool = True) -> str:
     """Normalize a player/team/league string for comparisons and indexing.
@@ -23,7 +28,11 @@ def normalize_name(s: str, transliterate: bool = True) -> str:
     """
     if not s:
         return ""
-    s = str(s).strip()
+    s = str(s)
+    # Zero-copy fast path: clean ASCII input needs no Unicode/regex passes
+    if _ALREADY_NORMALIZED_RE.fullmatch(s):
+        return s
+    s = s.strip()
     s = unicodedata.normalize("NFKC", s)
     if transliterate and _HAS_UNIDECODE:
         try:
@@ -37,3 +46,22 @@ def normalize_name(s: str, transliterate: bool = True) -> str:
     s = re.sub(r"[^\w\s]", " ", s, flags=re.U)
     s = re.sub(r"\s+", " ", s).strip()
     return s
+
+
+# Memoized variant for the request hot paths: a production stream is
+# dominated by repeat lookups of the same handful of names, so the
+# substitution/transliteration passes reduce to one dict probe.
+# Hit rate is observable via normalize_name_cached.cache_info().
+normalize_name_cached = functools.lru_cache(maxsize=16384)(normalize_name)
+
+
+def consonant_sig(s: str) -> str:
+    """Vowel-stripped signature of a normalized name.
+
+    Spelling variants and most typos of the same name collapse to the same
+    signature ("giannis" and "gianis" → "gns"), so equality on this string
+    works as a cheap indexable pre-filter before any fuzzy comparison.
+    Runs of the same letter are collapsed; word boundaries are kept.
+    """
+    stripped = "".join(ch for ch in normalize_name_cached(s or "", True) if ch not in "aeiouy")
+    return re.sub(r"(.)\1+", r"\1", stripped)
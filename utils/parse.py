@@ -1,6 +1,7 @@
 # utils/parse.py
 from __future__ import annotations
 
+import functools
 import re
 from typing import Dict, List, Optional, Tuple
 
@@ -52,6 +53,46 @@ _SKILL_LINE_RE = re.compile(
     re.IGNORECASE,
 )
 
+# Any section heading (## .. ######)
+_HEADING_RE = re.compile(r"^\s*#{2,6}\s+")
+
+# One-shot patterns previously compiled inline at each call site
+_PAREN_SPLIT_RE = re.compile(r"^(.+?)\s*\((.+?)\)\s*$")
+_TRAILING_PAREN_RE = re.compile(r"\s*\([^\)]*\)\s*$")
+_NAME_PAREN_RE = re.compile(r"^(?P<name>[^\(\n\r]+)\s*\([^\)]+\)\s*$")
+_HYPHENATED_RE = re.compile(r"[a-z]+-[a-z]+", re.IGNORECASE)
+_NON_NAME_CHARS_RE = re.compile(r"[^A-Za-z \-]")
+_WS_RUN_RE = re.compile(r"\s+")
+_BULLET_PREFIX_RE = re.compile(r"^\s*[-*\u2022]\s*")
+_SCORE_NUM_RE = re.compile(r"([0-5](?:\.[0-9]+)?)")
+_INLINE_HEADING_RE = re.compile(r"(?<!\n)(\s*)(#{1,6}\s+)")
+_TITLE_LINE_RE = re.compile(r"^\s*#{1,6}\s*scouting report\b.*", re.IGNORECASE)
+_MULTI_BLANK_RE = re.compile(r"\n\n+")
+
+
+# ----------------------------
+# Shared line scan
+# ----------------------------
+#
+# Every extractor used to re-normalize and re-split the same report_md
+# string independently, so one payload build scanned the full text five
+# or six times. The split (and the heading positions derived from it)
+# are memoized on the string itself; extractors share the result.
+
+
+@functools.lru_cache(maxsize=64)
+def _report_lines(report_md: str) -> Tuple[str, ...]:
+    """CRLF-normalized lines of report_md, split once per distinct text."""
+    return tuple(report_md.replace("\r\n", "\n").splitlines())
+
+
+@functools.lru_cache(maxsize=64)
+def _heading_indices(report_md: str) -> Tuple[int, ...]:
+    """Line indices of section headings (## .. ######), in order."""
+    return tuple(
+        i for i, line in enumerate(_report_lines(report_md)) if _HEADING_RE.match(line)
+    )
+
 
 # ----------------------------
 # Info fields
@@ -64,7 +105,7 @@ def _split_team_league(text: str) -> Tuple[str, str]:
         return "Unknown", "Unknown"
 
     # "Milwaukee Bucks (NBA)"
-    m = re.match(r"^(.+?)\s*\((.+?)\)\s*$", s)
+    m = _PAREN_SPLIT_RE.match(s)
     if m:
         return clean_value(m.group(1), "Unknown"), clean_value(m.group(2), "Unknown")
 
@@ -140,7 +181,7 @@ def extract_info_fields(report_md: str) -> Dict[str, str]:
     if not report_md:
         return fields
 
-    lines = report_md.replace("\r\n", "\n").splitlines()[:120]
+    lines = _report_lines(report_md)[:120]
 
     for line in lines:
         s = line.strip()
@@ -262,7 +303,7 @@ def extract_canonical_player(report_md: str) -> str:
         pass
 
     # Look at the first 10 lines for title-like patterns
-    lines = report_md.replace("\r\n", "\n").splitlines()[:10]
+    lines = _report_lines(report_md)[:10]
     for ln in lines:
         s = ln.strip()
         if not s:
@@ -275,12 +316,12 @@ def extract_canonical_player(report_md: str) -> str:
         if m:
             name = m.group("name").strip()
             # remove trailing team in parentheses if present
-            name = re.sub(r"\s*\([^\)]*\)\s*$", "", name).strip()
+            name = _TRAILING_PAREN_RE.sub("", name).strip()
             if name:
                 return name
 
         # Example: "Giannis Antetokounmpo (Milwaukee Bucks)"
-        m2 = re.match(r"^(?P<name>[^\(\n\r]+)\s*\([^\)]+\)\s*$", s)
+        m2 = _NAME_PAREN_RE.match(s)
         if m2:
             name = m2.group("name").strip()
             if name:
@@ -304,7 +345,7 @@ def _extract_from_verified_note(report_md: str) -> str:
         )
         if m:
             name = m.group("name").strip()
-            name = re.sub(r"\s*\([^\)]*\)\s*$", "", name).strip()
+            name = _TRAILING_PAREN_RE.sub("", name).strip()
             if name:
                 return name
     except Exception:
@@ -325,9 +366,9 @@ def _extract_from_urls(report_md: str) -> str:
             if not last:
                 continue
             # common pattern: giannis-antetokounmpo
-            if re.search(r"[a-z]+-[a-z]+", last, re.IGNORECASE):
+            if _HYPHENATED_RE.search(last):
                 nm = last.replace("-", " ")
-                nm = re.sub(r"[^A-Za-z \-]", "", nm).strip()
+                nm = _NON_NAME_CHARS_RE.sub("", nm).strip()
                 if nm and " " in nm:
                     # Title-case the extracted slug
                     return " ".join([p.capitalize() for p in nm.split()])
@@ -385,24 +426,20 @@ def _parse_first_md_table(
 
 
 def _section_lines(report_md: str, head_re: re.Pattern) -> Optional[List[str]]:
-    lines = report_md.replace("\r\n", "\n").splitlines()
-    start = None
+    lines = _report_lines(report_md)
+    heads = _heading_indices(report_md)
 
-    for i, line in enumerate(lines):
-        if head_re.match(line):
-            start = i + 1
+    start = None
+    for h in heads:
+        if head_re.match(lines[h]):
+            start = h + 1
             break
 
     if start is None:
         return None
 
-    end = len(lines)
-    for j in range(start, len(lines)):
-        if re.match(r"^\s*#{2,6}\s+", lines[j]):
-            end = j
-            break
-
-    return lines[start:end]
+    end = next((h for h in heads if h >= start), len(lines))
+    return list(lines[start:end])
 
 
 def _header_map(headers: List[str], row: List[str]) -> Dict[str, str]:
@@ -514,14 +551,14 @@ def _extract_final_verdict(report_md: str) -> str:
         return clean_value(m.group(1), "")
 
     # Heading + next non-empty line
-    lines = report_md.replace("\r\n", "\n").splitlines()
-    for i, line in enumerate(lines):
-        if _HEAD_VERDICT_RE.match(line):
+    lines = _report_lines(report_md)
+    for i in _heading_indices(report_md):
+        if _HEAD_VERDICT_RE.match(lines[i]):
             for j in range(i + 1, min(i + 8, len(lines))):
                 s = lines[j].strip()
                 if not s:
                     continue
-                if re.match(r"^\s*#{2,6}\s+", s):
+                if _HEADING_RE.match(s):
                     return ""
                 return clean_value(s, "")
             return ""
@@ -544,21 +581,18 @@ def extract_grades(report_md: str) -> Tuple[List[dict], str]:
 
     final_verdict = _extract_final_verdict(report_md)
 
-    lines = report_md.replace("\r\n", "\n").splitlines()
+    lines = _report_lines(report_md)
+    heads = _heading_indices(report_md)
 
     # Find grades heading
     start = None
-    for i, line in enumerate(lines):
-        if _HEAD_GRADES_RE.match(line):
-            start = i + 1
+    for h in heads:
+        if _HEAD_GRADES_RE.match(lines[h]):
+            start = h + 1
             break
 
     if start is not None:
-        end = len(lines)
-        for j in range(start, len(lines)):
-            if re.match(r"^\s*#{2,6}\s+", lines[j]):
-                end = j
-                break
+        end = next((h for h in heads if h >= start), len(lines))
         section_lines = lines[start:end] if start < end else lines[-350:]
     else:
         section_lines = lines[-350:]
@@ -582,7 +616,7 @@ def extract_grades(report_md: str) -> Tuple[List[dict], str]:
 
     # 1) Parse pipe rows like "| Shooting | 3/5 |"
     for skill, score in _PIPE_ROW_RE.findall(section_text):
-        s = re.sub(r"\s+", " ", (skill or "")).strip()
+        s = _WS_RUN_RE.sub(" ", (skill or "")).strip()
         if s.lower() in {"category", "grade"}:
             continue
         sc = max(0.0, min(5.0, float(score)))
@@ -593,14 +627,14 @@ def extract_grades(report_md: str) -> Tuple[List[dict], str]:
         line = (raw or "").strip()
         if not line:
             continue
-        line = re.sub(r"^\s*[-*•]\s*", "", line)
+        line = _BULLET_PREFIX_RE.sub("", line)
         line = line.replace("**", "").replace("__", "").strip()
 
         m = _SKILL_LINE_RE.match(line)
         if not m:
             continue
 
-        skill = re.sub(r"\s+", " ", m.group(1)).strip()
+        skill = _WS_RUN_RE.sub(" ", m.group(1)).strip()
         if skill.lower().startswith("final verdict"):
             continue
 
@@ -629,7 +663,7 @@ def extract_grades(report_md: str) -> Tuple[List[dict], str]:
         for i in range(0, len(parts) - 1, 2):
             skill = parts[i]
             score_txt = parts[i + 1]
-            m = re.search(r"([0-5](?:\.[0-9]+)?)", score_txt)
+            m = _SCORE_NUM_RE.search(score_txt)
             if not m:
                 continue
             sc = max(0.0, min(5.0, float(m.group(1))))
@@ -665,7 +699,7 @@ def _strip_sections_by_heading(md: str) -> str:
             skipping = True
             continue
 
-        if skipping and re.match(r"^\s*#{2,6}\s+", line):
+        if skipping and _HEADING_RE.match(line):
             skipping = False
 
         if skipping:
@@ -696,7 +730,7 @@ def extract_display_md(report_md: str) -> str:
     # proper newline-prefixed heading so downstream section-stripping and the
     # markdown renderer treat them as headings.
     try:
-        md = re.sub(r"(?<!\n)(\s*)(#{1,6}\s+)", r"\n\n\2", md)
+        md = _INLINE_HEADING_RE.sub(r"\n\n\2", md)
     except Exception:
         pass
 
@@ -706,11 +740,14 @@ def extract_display_md(report_md: str) -> str:
     lines = md.replace("\r\n", "\n").splitlines()
 
     # 2) Remove the report title if present (e.g., "## Scouting Report" or "## Scouting Report — Player Name")
-    if lines and re.match(r"^\s*#{1,6}\s*scouting report\b.*", lines[0], re.IGNORECASE):
+    if lines and _TITLE_LINE_RE.match(lines[0]):
         lines = lines[1:]
 
-    # 3) Remove bold header info fields until first ### section
-    out: List[str] = []
+    # 3-5) Single pass: drop bold header info fields until the first ###
+    # section, filter collapsed one-line blocks / source leaks / url-like
+    # lines / stray table separators, and scrub urls from what survives.
+    # One walk and one output list instead of three chained loops.
+    cleaned: List[str] = []
     in_header = True
 
     for line in lines:
@@ -719,22 +756,9 @@ def extract_display_md(report_md: str) -> str:
         if in_header:
             if s.startswith("### "):
                 in_header = False
-                out.append(line)
+            elif _BOLD_FIELD_RE.match(s) or s == "":
                 continue
-
-            if _BOLD_FIELD_RE.match(s) or s == "":
-                continue
-
             # keep any intro line before sections if exists
-            out.append(line)
-            continue
-
-        out.append(line)
-
-    # 4) Remove collapsed one-line blocks + url lines + leftover table separators
-    cleaned: List[str] = []
-    for line in out:
-        s = (line or "").strip()
 
         # "Grades ... | ... | ..." or "Season snapshot ... | ... | ..."
         if _COLLAPSED_BLOCK_RE.match(s):
@@ -752,16 +776,11 @@ def extract_display_md(report_md: str) -> str:
         if _MD_TABLE_SEP_RE.match(s):
             continue
 
-        cleaned.append(line)
-
-    # 5) Final pass: scrub urls/domains from remaining text
-    final_lines = []
-    for line in cleaned:
-        final_lines.append(scrub_urls(line))
+        cleaned.append(scrub_urls(line))
 
-    result = "\n".join(final_lines).strip()
+    result = "\n".join(cleaned).strip()
     
     # 6) Clean up multiple consecutive blank lines (collapse to max 1 blank line)
-    result = re.sub(r"\n\n+", "\n\n", result)
+    result = _MULTI_BLANK_RE.sub("\n\n", result)
     
     return result
@@ -4,76 +4,86 @@ Handles populating derived fields (HTML rendering, parsed metadata),
 fetching reports from database, and ensuring payloads have all required fields.
 """
 
+import functools
 import logging
 
 from utils.normalize import normalize_name
-from utils.parse import extract_display_md
+from utils.parse import (
+    extract_display_md,
+    extract_grades,
+    extract_info_fields,
+    extract_last3_games,
+    extract_season_snapshot,
+)
 from utils.render import md_to_safe_html
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=2048)
+def _derive(report_md: str):
+    """Derived display fields for a report, memoized on the markdown.
+
+    Every field is a pure function of report_md, so repeat payloads for
+    the same report (library views, suggestions, cache hits) resolve to
+    a cache lookup instead of re-parsing and re-sanitizing. Keyed on the
+    string itself — CPython caches str hashes, so lookups stay cheap.
+    """
+    try:
+        report_html = md_to_safe_html(extract_display_md(report_md))
+    except Exception:
+        report_html = ""
+    try:
+        info_fields = extract_info_fields(report_md)
+    except Exception:
+        info_fields = {}
+    try:
+        grades, final_verdict = extract_grades(report_md)
+    except Exception:
+        grades, final_verdict = [], ""
+    try:
+        season_snapshot = extract_season_snapshot(report_md)
+    except Exception:
+        season_snapshot = {}
+    try:
+        last3_games = extract_last3_games(report_md)
+    except Exception:
+        last3_games = []
+    return report_html, info_fields, grades, final_verdict, season_snapshot, last3_games
+
+
 def _ensure_parsed_payload(payload: dict) -> dict:
     """Populate derived fields from markdown when missing and ensure `report_html`.
 
     Best-effort helper used by cached/library/suggestion paths so the client
     receives structured `info_fields`, `grades`, `season_snapshot`,
-    `last3_games`, and `report_html` when possible.
+    `last3_games`, and `report_html` when possible. Structured fields are
+    copied out of the shared cache entry because callers mutate payloads.
     """
     if not isinstance(payload, dict):
         return payload
 
-    report_md = (payload.get("report_md") or "")
-    try:
-        display_md = extract_display_md(report_md)
-        payload.setdefault("report_html", md_to_safe_html(display_md))
-    except Exception:
-        payload.setdefault("report_html", "")
-
-    try:
-        from utils.parse import (
-            extract_info_fields,
-            extract_grades,
-            extract_season_snapshot,
-            extract_last3_games,
-        )
-
-        if not payload.get("info_fields"):
-            try:
-                payload["info_fields"] = extract_info_fields(report_md)
-            except Exception:
-                payload["info_fields"] = {}
-
-        if not payload.get("grades"):
-            try:
-                grades, final_verdict = extract_grades(report_md)
-                payload["grades"] = grades
-                payload["final_verdict"] = final_verdict
-            except Exception:
-                payload["grades"] = []
-                payload.setdefault("final_verdict", "")
-
-        if not payload.get("season_snapshot"):
-            try:
-                payload["season_snapshot"] = extract_season_snapshot(report_md)
-            except Exception:
-                payload["season_snapshot"] = {}
-
-        if not payload.get("last3_games"):
-            try:
-                payload["last3_games"] = extract_last3_games(report_md)
-            except Exception:
-                payload["last3_games"] = []
-    except Exception:
-        # If parsing helpers are unavailable, leave payload as-is
-        pass
+    report_html, info_fields, grades, final_verdict, season_snapshot, last3_games = (
+        _derive(payload.get("report_md") or "")
+    )
+
+    payload.setdefault("report_html", report_html)
+    if not payload.get("info_fields"):
+        payload["info_fields"] = dict(info_fields)
+    if not payload.get("grades"):
+        payload["grades"] = [dict(g) for g in grades]
+        payload["final_verdict"] = final_verdict
+    if not payload.get("season_snapshot"):
+        payload["season_snapshot"] = dict(season_snapshot)
+    if not payload.get("last3_games"):
+        payload["last3_games"] = [dict(g) for g in last3_games]
 
     return payload
 
 
 def fetch_report_payload(user_id: str, report_id: int):
     """Fetch report payload, trying get_report first, then direct Postgres query.
-    
+
     Returns the payload dict or None if not found.
     Handles report_md reconstruction from split columns.
     """
@@ -83,7 +93,7 @@ def fetch_report_payload(user_id: str, report_id: int):
         suggestion_payload = get_report(user_id, report_id)
     except Exception:
         pass
-    
+
     # If not found, try a direct Postgres read
     if not suggestion_payload:
         try:
@@ -100,11 +110,11 @@ def fetch_report_payload(user_id: str, report_id: int):
                 report_md = prow[1] or ""
                 narrative_md = prow[2]
                 stats_md = prow[3]
-                
+
                 # Reconstruct report_md from split columns if they exist
                 if narrative_md and stats_md:
                     report_md = narrative_md + "\n\n" + stats_md
-                
+
                 if payload_row:
                     suggestion_payload = payload_row
                     if (
@@ -133,5 +143,5 @@ def fetch_report_payload(user_id: str, report_id: int):
                     pass
         except Exception:
             pass
-    
+
     return suggestion_payload
@@ -6,15 +6,20 @@ except Exception:
     jellyfish = None
     _HAS_JELLYFISH = False
 
+import functools
 import re
 
 
+@functools.lru_cache(maxsize=8192)
 def phonetic_key(s: str) -> str:
     """Return a phonetic key for `s`.
 
     Priority:
     - If `jellyfish` available, use `jellyfish.metaphone`.
     - Otherwise, fallback to a consonant skeleton (drop vowels + collapse repeats).
+
+    Memoized: surname sets repeat heavily across matching requests, so the
+    key is computed once per distinct string process-wide.
     """
     if not s:
         return ""
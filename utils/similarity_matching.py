@@ -7,13 +7,14 @@ Provides functions to find similar player reports via:
 Used by the scout service to find existing reports before generating new ones.
 """
 
+import functools
 import logging
 import os
-import re
 import sys
 import time
+from collections import namedtuple
 
-from utils.normalize import normalize_name
+from utils.normalize import normalize_name_cached
 from utils.name_matching import (
     _compute_name_similarity,
     _check_first_name_alignment,
@@ -27,25 +28,174 @@ from utils.phonetic import phonetic_key
 
 logger = logging.getLogger(__name__)
 
-# Fuzzy matching library setup
-try:
-    from rapidfuzz import fuzz
+# Vowel stripper for consonant-skeleton comparison; translate beats a
+# per-candidate re.sub on short surnames.
+_VOWEL_TBL = str.maketrans("", "", "aeiou")
 
-    _token_sort_ratio = getattr(fuzz, "token_sort_ratio", None)
-    _token_set_ratio = getattr(fuzz, "token_set_ratio", None)
-    if _token_sort_ratio is None:
-        from rapidfuzz.fuzz import token_sort_ratio as _token_sort_ratio
+# How many of the highest-scoring candidates receive the per-candidate
+# alignment and phonetic adjustments after bulk scoring.
+_POST_TOP_K = 8
+
+# Short-lived per-user cache of the recent-reports fallback window used
+# when the trigram lookup misses. New reports show up after the TTL.
+_FALLBACK_CACHE: dict = {}
+_FALLBACK_TTL_S = 10.0
+
+# Matching thresholds, read once at import instead of per request
+# (os.getenv plus float parsing sat on the embedding hot path).
+EMBED_AUTO_THRESHOLD = 0.86
+EMBED_SUGGEST_THRESHOLD = 0.78
+FUZZY_TIMEOUT_SECS = 3.0
+
+
+def reload_config() -> None:
+    """Re-read threshold env vars; normally only run once at import."""
+    global EMBED_AUTO_THRESHOLD, EMBED_SUGGEST_THRESHOLD, FUZZY_TIMEOUT_SECS
+    EMBED_AUTO_THRESHOLD = float(os.getenv("EMBED_AUTO_THRESHOLD", "0.86"))
+    EMBED_SUGGEST_THRESHOLD = float(os.getenv("EMBED_SUGGEST_THRESHOLD", "0.78"))
+    FUZZY_TIMEOUT_SECS = float(os.getenv("FUZZY_TIMEOUT_SECS", "3.0"))
+
+
+reload_config()
+
+
+# Everything the matching loops derive from one name, computed in a
+# single pass over the normalized string. Unpacks like a plain tuple.
+NameInfo = namedtuple(
+    "NameInfo", "norm parts first first_canon last phonetic_last reduced"
+)
+
+
+@functools.lru_cache(maxsize=20000)
+def _prep_name(name_raw: str, transliterate: bool) -> NameInfo:
+    """NameInfo for a raw player name: one normalize, one split.
+
+    The candidate set (saved reports) changes slowly and the same names
+    come back on every scan, so these derivations are memoized across
+    requests rather than recomputed per call.
+    """
+    name_norm = normalize_name_cached(name_raw, transliterate=transliterate)
+    parts = tuple(name_norm.split())
+    first = parts[0] if parts else ""
+    last = parts[-1] if parts else ""
+    first_canon = NICKNAME_MAP.get(first, first)
+    reduced = f"{first} {last}" if len(parts) >= 2 else name_norm
+    try:
+        phonetic_last = phonetic_key(last)
+    except Exception:
+        phonetic_last = None
+    return NameInfo(name_norm, parts, first, first_canon, last, phonetic_last, reduced)
+
+
+# Fuzzy matching scorers, bound once at import so the hot loops carry no
+# per-iteration dispatch or availability checks. rapidfuzz is pinned in
+# requirements.txt; the difflib bindings exist only for environments
+# without its compiled wheels.
+try:
+    from rapidfuzz.fuzz import ratio as _plain_ratio
+    from rapidfuzz.fuzz import token_set_ratio as _token_set_ratio
+    from rapidfuzz.fuzz import token_sort_ratio as _token_sort_ratio
 
-        try:
-            from rapidfuzz.fuzz import token_set_ratio as _token_set_ratio
-        except Exception:
-            _token_set_ratio = None
     _HAS_RAPIDFUZZ = True
+
+    def _sort_ratio(a: str, b: str) -> int:
+        if a == b:
+            return 100
+        return int(_token_sort_ratio(a, b) or 0)
+
+    def _set_ratio(a: str, b: str) -> int:
+        if a == b:
+            return 100
+        return int(_token_set_ratio(a, b) or 0)
+
+    # For single tokens (name parts) the token scorers reduce to plain
+    # ratio anyway; calling it directly skips tokenize + set-ops.
+    def _part_ratio(a: str, b: str) -> int:
+        if a == b:
+            return 100
+        return int(_plain_ratio(a, b) or 0)
 except Exception:
+    from difflib import SequenceMatcher as _SequenceMatcher
+
     _token_sort_ratio = None
     _token_set_ratio = None
     _HAS_RAPIDFUZZ = False
 
+    def _sort_ratio(a: str, b: str) -> int:
+        # Equal strings skip the matcher, whose setup alone walks both
+        # strings to build the junk/b2j tables.
+        if a == b:
+            return 100
+        if not a or not b:
+            return 0
+        return int(_SequenceMatcher(None, a, b).ratio() * 100)
+
+    _set_ratio = _sort_ratio
+    _part_ratio = _sort_ratio
+    _plain_ratio = None
+
+
+# Batched scoring entry point, guarded separately from the scorers
+# because process additionally requires numpy.
+try:
+    from rapidfuzz import process as _rf_process
+except Exception:
+    _rf_process = None
+
+
+# Consonant skeletons are single short tokens, so the indel similarity
+# (the metric SequenceMatcher.ratio approximates) fits better than the
+# token scorers and runs in C when rapidfuzz is present.
+try:
+    from rapidfuzz.distance import Indel as _Indel
+
+    def _skeleton_sim(a: str, b: str) -> int:
+        return int(_Indel.normalized_similarity(a, b) * 100)
+except Exception:
+
+    def _skeleton_sim(a: str, b: str) -> int:
+        return _sort_ratio(a, b)
+
+
+def _alignment_pair_sims(first_p: str, last_p: str, first_n: str, last_n: str):
+    """All four first/last-name pair similarities in one batched call.
+
+    Direct and cross alignment consume the full 2x2 pair matrix, which
+    cdist produces with a single C dispatch instead of four scorer
+    calls per candidate. Returns (first_direct, last_direct,
+    first_cross, last_cross).
+    """
+    if _rf_process is not None and _plain_ratio is not None and first_p and last_p and first_n and last_n:
+        try:
+            m = _rf_process.cdist(
+                [first_p, last_p], [first_n, last_n], scorer=_plain_ratio
+            )
+            return int(m[0][0]), int(m[1][1]), int(m[0][1]), int(m[1][0])
+        except Exception:
+            pass
+    return (
+        _compute_name_similarity(first_p, first_n),
+        _compute_name_similarity(last_p, last_n),
+        _compute_name_similarity(first_p, last_n),
+        _compute_name_similarity(last_p, first_n),
+    )
+
+
+def _surname_first_check(
+    player_norm: str,
+    candidate_name: str,
+    score: int,
+    primary_threshold: int = LASTNAME_HIGH,
+) -> bool:
+    """Shared safety gate for embedding matches: surnames must align and
+    the first name must clear the alignment thresholds for the score."""
+    cand_norm = normalize_name_cached(candidate_name, transliterate=True)
+    if not _last_names_align(player_norm, cand_norm):
+        return False
+    return _check_first_name_alignment(
+        player_norm, candidate_name, score, primary_threshold, candidate_norm=cand_norm
+    )
+
 
 def _find_by_embedding_similarity(
     user_id: str,
@@ -67,64 +217,49 @@ def _find_by_embedding_similarity(
     try:
         from utils.embeddings import find_nearest
         
-        player_norm = normalize_name(player, transliterate=True)
+        player_norm = normalize_name_cached(player, transliterate=True)
         league_norm = (league or "").strip().lower()
         team_norm = (team or "").strip().lower()
         
         # Find nearest neighbors by embedding
         tops = find_nearest(client, player, top_k=5)
-        
+
         if not tops:
             return None
-        
-        best_rid, best_sim = tops[0]
-        
-        # Check league/team constraints
+
+        # Fetch every neighbor's payload in one round trip, league filter
+        # applied in SQL; "*" means search all users (global suggestions).
+        # The old path did a get_report per candidate, sequentially, just
+        # to discover league mismatches in Python.
         try:
-            # If user_id is "*", fetch from any user (global search)
-            if user_id == "*":
-                from db import get_report_by_id
-                payload = get_report_by_id(int(best_rid))
-            else:
-                from db import get_report
-                payload = get_report(user_id, int(best_rid))
-            
-            if not payload:
-                return None
-            
-            cand_league = (payload.get("league") or "").strip().lower()
-            cand_team = (payload.get("team") or payload.get("team_name") or "").strip().lower()
-            
-            if league_norm and cand_league and league_norm != cand_league:
-                # Try next best
-                if len(tops) > 1:
-                    best_rid, best_sim = tops[1]
-                    if user_id == "*":
-                        from db import get_report_by_id
-                        payload = get_report_by_id(int(best_rid))
-                    else:
-                        from db import get_report
-                        payload = get_report(user_id, int(best_rid))
-                    if not payload:
-                        return None
-                    cand_league = (payload.get("league") or "").strip().lower()
-                    if league_norm and cand_league and league_norm != cand_league:
-                        return None
-                else:
-                    return None
-            
-            if not league_norm and team_norm and cand_team and team_norm != cand_team:
-                return None  # Team provided and doesn't match
+            from db import get_reports_by_ids
+            payloads = get_reports_by_ids(
+                [int(rid) for rid, _ in tops],
+                user_id=None if user_id == "*" else user_id,
+                league=league_norm,
+            )
         except Exception:
             return None
+
+        # Walk neighbors in rank order; the first one surviving the
+        # league/team gates is the match the old two-step retry selected.
+        best_rid = best_sim = payload = None
+        for rid, sim in tops:
+            cand = payloads.get(int(rid))
+            if not cand:
+                continue  # missing, out of scope, or league-filtered
+            cand_team = (cand.get("team") or cand.get("team_name") or "").strip().lower()
+            if not league_norm and team_norm and cand_team and team_norm != cand_team:
+                continue  # Team provided and doesn't match
+            best_rid, best_sim, payload = rid, sim, cand
+            break
+        if payload is None:
+            return None
         
         # Check first/last name alignment (safety check)
         nn = payload.get("player") or ""
-        if not _last_names_align(player_norm, normalize_name(nn)):
-            return None
-        
-        if not _check_first_name_alignment(player_norm, nn, int(best_sim * 100), 95):
-            return None  # First name too different
+        if not _surname_first_check(player_norm, nn, int(best_sim * 100), 95):
+            return None  # Surname or first name too different
         
         # Return based on similarity threshold
         if best_sim >= auto_threshold:
@@ -165,19 +300,73 @@ def _best_similar_report(
     """
     if not player or not player.strip():
         return None
-    player_norm = normalize_name(player, transliterate=transliterate)
+    player_norm = normalize_name_cached(player, transliterate=transliterate)
     started = time.monotonic()
-    max_secs = float(os.getenv("FUZZY_TIMEOUT_SECS", "3.0"))
+    max_secs = FUZZY_TIMEOUT_SECS
+    try:
+        suggest_cap = int(suggest_threshold) - 1
+    except Exception:
+        suggest_cap = 84
+
+    # Normalize provided league/team for quick checks
+    league_norm = (league or "").strip().lower()
+    team_norm = (team or "").strip().lower()
+
+    # Exact normalized-name hits resolve on the player_name_norm btree
+    # index before any candidate window is fetched or scanned. Nickname
+    # and phonetic near-exact matches still fall through to the Python
+    # exact-match loop below.
+    try:
+        from db import find_report_exact_norm
+        for row in find_report_exact_norm(user_id, player_norm, league=league_norm):
+            cand_team = (row.get("team") or "").strip().lower()
+            if team_norm and cand_team and team_norm != cand_team:
+                continue  # Team mismatch, keep looking
+            # Score 100 triggers auto-accept on the caller side, same as
+            # the in-loop exact match.
+            return {
+                "type": "suggest",
+                "report_id": int(row.get("id")),
+                "player_name": (row.get("player_name") or "").strip(),
+                "score": 100,
+            }
+    except Exception:
+        pass
 
     candidates = []
     # Search Postgres FIRST (where current reports live)
     # Do NOT fallback to SQLite — that's old/stale data and may include other users' reports
+    # Prefer the indexed pg_trgm K-NN lookup: similarity runs in C inside
+    # the server and returns a handful of rows instead of a scan window.
     try:
-        from db import list_reports
-        candidates = list_reports(user_id, q="", limit=max_scan)
+        from db import find_similar_reports_trgm
+        candidates = find_similar_reports_trgm(user_id, player_norm, limit=10)
     except Exception:
         candidates = []
 
+    if not candidates:
+        # Trigram miss (or extension unavailable): fall back to the recent
+        # window so nickname matches with low trigram overlap still work.
+        # The window is cached briefly per user — bursts of scans (e.g.
+        # autocomplete) would otherwise re-run the same unfiltered PG
+        # query on every call.
+        cache_key = (user_id, max_scan, league_norm)
+        now = time.monotonic()
+        entry = _FALLBACK_CACHE.get(cache_key)
+        if entry and entry[0] > now:
+            candidates = entry[1]
+        else:
+            try:
+                from db import list_reports
+                # League narrowing happens in SQL so the window holds only
+                # rows the prep loop below could accept.
+                candidates = list_reports(user_id, q="", limit=max_scan, league=league_norm)
+            except Exception:
+                candidates = []
+            if len(_FALLBACK_CACHE) >= 1024:
+                _FALLBACK_CACHE.clear()
+            _FALLBACK_CACHE[cache_key] = (now + _FALLBACK_TTL_S, candidates)
+
     # If no Postgres candidates, return None (don't search SQLite)
     # SQLite is only for embeddings storage, not for matching
 
@@ -186,58 +375,84 @@ def _best_similar_report(
         # No reports in Postgres for this user → no fuzzy matches possible
         return None
 
-    # Normalize provided league/team for quick checks
-    league_norm = (league or "").strip().lower()
-    team_norm = (team or "").strip().lower()
-
     # EXACT MATCH CHECK: If we find an exact normalized match from another user,
     # return it as a suggestion with score=100 so it auto-accepts and saves to their library
     # This includes nickname-aware matching (e.g., "Kostas" matches "Konstantinos")
-    player_parts = player_norm.split()
-    player_first = player_parts[0] if player_parts else ""
-    player_last = player_parts[-1] if player_parts else ""
-    player_first_canon = NICKNAME_MAP.get(player_first, player_first)
-    
+    # The query goes through the same memoized prep as the candidates, so
+    # repeated searches for the same player derive everything once.
+    query_info = _prep_name(player, transliterate)
+    player_parts = query_info.parts
+    player_first = query_info.first
+    player_last = query_info.last
+    player_first_canon = query_info.first_canon
+    player_reduced = query_info.reduced
+    player_phonetic = query_info.phonetic_last
+
+    # Prep every candidate once up front (names memoized across requests,
+    # league/team lowered and interned); both scan loops below reuse the
+    # same derived tuples instead of re-running strip/lower per check.
+    prepped = []
+    # Reverse index of candidate surnames by phonetic key, so phonetic
+    # boosting can target its bucket instead of scanning every row.
+    phonetic_buckets = {}
+    # Local bindings for the O(N) loops below — skips the per-iteration
+    # LOAD_GLOBAL (and module-attribute walk for sys.intern).
+    _intern = sys.intern
+    _prep = _prep_name
+    _now = time.monotonic
     for c in candidates:
-        try:
-            if time.monotonic() - started > max_secs:
-                return None
-        except Exception:
-            pass
         name_raw = (c.get("player_name") or c.get("player") or "").strip()
         if not name_raw:
             continue
-        name_norm = normalize_name(name_raw, transliterate=transliterate)
-        
+        cand_league = _intern((c.get("league") or c.get("league_norm") or "").strip().lower())
+        # League mismatches can never match or suggest below, so they are
+        # rejected here — before paying for name normalization or scoring.
+        if league_norm and cand_league and league_norm != cand_league:
+            continue
+        cand_team = _intern((c.get("team") or "").strip().lower())
+        prep = _prep(name_raw, transliterate)
+        if prep.phonetic_last:
+            phonetic_buckets.setdefault(prep.phonetic_last, []).append(len(prepped))
+        prepped.append((c, name_raw, prep, cand_league, cand_team))
+
+    # Candidates sharing the query surname go first: exact matches
+    # dominate real traffic, so the loop usually returns within its
+    # first few iterations instead of walking the whole window. The
+    # phonetic-bucket indices into `prepped` are unaffected — only the
+    # iteration order of this loop changes.
+    scan_order = prepped
+    if player_last:
+        primary = [t for t in prepped if t[2].last == player_last]
+        if primary and len(primary) < len(prepped):
+            scan_order = primary + [t for t in prepped if t[2].last != player_last]
+
+    for c, name_raw, (name_norm, name_parts, name_first, name_first_canon, name_last, name_phonetic, _), cand_league, cand_team in scan_order:
+        if _now() - started > max_secs:
+            return None
+
         # Check for exact match (including nickname equivalence)
         is_exact_match = False
         if player_norm == name_norm:
             is_exact_match = True
         else:
-            # Check nickname-canonicalized match
-            name_parts = name_norm.split()
-            name_first = name_parts[0] if name_parts else ""
-            name_last = name_parts[-1] if name_parts else ""
-            name_first_canon = NICKNAME_MAP.get(name_first, name_first)
-            
+            # Check nickname-canonicalized match (canonical first name is
+            # precomputed per candidate)
+
             # Match if: same last name + same canonical first name
             # Also allow phonetic last name match for common typos (e.g., Farid vs Faried)
             last_name_match = player_last == name_last
             if not last_name_match:
                 try:
                     # Check phonetic similarity for last names (handles 1-letter typos)
-                    from utils.phonetic import phonetic_key
-                    p_phonetic = phonetic_key(player_last)
-                    n_phonetic = phonetic_key(name_last)
+                    p_phonetic = player_phonetic
+                    n_phonetic = name_phonetic
                     if p_phonetic and n_phonetic and p_phonetic == n_phonetic:
                         last_name_match = True
                     # Also check string distance for very close matches
                     elif player_last and name_last:
                         # Allow 1-char difference for names >= 5 chars
                         if len(player_last) >= 5 and len(name_last) >= 5:
-                            from difflib import SequenceMatcher
-                            sim = SequenceMatcher(None, player_last, name_last).ratio()
-                            if sim >= 0.85:  # 85% similarity
+                            if _part_ratio(player_last, name_last) >= 85:
                                 last_name_match = True
                 except Exception:
                     pass
@@ -246,16 +461,9 @@ def _best_similar_report(
                 is_exact_match = True
         
         if is_exact_match:
-            # Check league/team constraints
-            try:
-                cand_league = (c.get("league") or "").strip().lower()
-                cand_team = (c.get("team") or "").strip().lower()
-                if league_norm and cand_league and league_norm != cand_league:
-                    continue  # League mismatch, keep looking
-                if team_norm and cand_team and team_norm != cand_team:
-                    continue  # Team mismatch, keep looking
-            except Exception:
-                pass
+            # Check team constraints (league filtering happened at prep)
+            if team_norm and cand_team and team_norm != cand_team:
+                continue  # Team mismatch, keep looking
 
             # Safety: ensure surnames align before suggesting
             if not _last_names_align(player_norm, name_norm):
@@ -279,14 +487,13 @@ def _best_similar_report(
         first_n = n_parts[0] if n_parts else ""
         last_n = n_parts[-1] if n_parts else ""
 
-        # Direct alignment (p_first vs n_first, p_last vs n_last)
-        first_sim_direct = _compute_name_similarity(first_p, first_n)
-        last_sim_direct = _compute_name_similarity(last_p, last_n)
+        # Direct (p_first vs n_first, p_last vs n_last) and cross
+        # (p_first vs n_last, p_last vs n_first) alignment, scored as a
+        # single batched 2x2 matrix.
+        first_sim_direct, last_sim_direct, first_sim_cross, last_sim_cross = (
+            _alignment_pair_sims(first_p, last_p, first_n, last_n)
+        )
         score_direct = last_sim_direct * 2 + first_sim_direct
-
-        # Cross alignment (p_first vs n_last, p_last vs n_first)
-        first_sim_cross = _compute_name_similarity(first_p, last_n)
-        last_sim_cross = _compute_name_similarity(last_p, first_n)
         score_cross = last_sim_cross * 2 + first_sim_cross
 
         if score_cross > score_direct:
@@ -308,144 +515,74 @@ def _best_similar_report(
             "last_sim": last_sim_direct,
         }
 
-    # Embedding pre-check (local-first then OpenAI fallback)
-    try:
-        from utils import embeddings as emb_utils
-        from utils.embeddings import find_nearest
-
-        def _handle_top(best_rid, best_sim):
-            if best_sim >= float(os.getenv("EMBED_AUTO_THRESHOLD", "0.86")):
-                try:
-                    from db import get_report
-
-                    payload = get_report(user_id, int(best_rid))
-                    if payload:
-                        try:
-                            cand_league = ((payload.get("league") or "").strip().lower())
-                            cand_team = ((payload.get("team") or payload.get("team_name") or "").strip().lower())
-                            if league_norm and cand_league and league_norm != cand_league:
-                                return None
-                            if not league_norm and team_norm and cand_team and team_norm != cand_team:
-                                return None
-                        except Exception:
-                            pass
-                        # Apply surname-firstname safety check
-                        nn = payload.get("player") or ""
-                        if not _last_names_align(player_norm, normalize_name(nn)):
-                            return None
-                        
-                        if not _check_first_name_alignment(player_norm, nn, int(best_sim * 100)):
-                            return None
-
-                        payload["cached"] = True
-                        payload["report_id"] = int(best_rid)
-                        payload["matched_player_name"] = payload.get("player")
-                        payload["matched_score"] = int(best_sim * 100)
-                        from db import get_balance
-                        payload["credits_remaining"] = get_balance(user_id)
-
-                        return {
-                            "type": "auto",
-                            "payload": payload,
-                            "score": int(best_sim * 100),
-                        }
-                except Exception:
-                    return None
-            if best_sim >= float(os.getenv("EMBED_SUGGEST_THRESHOLD", "0.78")):
-                try:
-                        from db import get_report
-                        # Always check first-name similarity for embedding suggestions
-                        # to avoid surname-only false matches (e.g., Okaro → Derrick).
-                        try:
-                            payload = get_report(user_id, int(best_rid))
-                            if payload:
-                                pn_parts = player_norm.split()
-                                nn = payload.get("player") or ""
-                                nn = payload.get("player") or ""
-                                if not _last_names_align(player_norm, normalize_name(nn)):
-                                    return None
-                                
-                                if not _check_first_name_alignment(player_norm, nn, int(best_sim * 100)):
-                                    return None
-                        except Exception:
-                            pass
-
-                        return {
-                            "type": "suggest",
-                            "report_id": int(best_rid),
-                            "player_name": get_report(user_id, int(best_rid)).get("player"),
-                            "score": int(best_sim * 100),
-                        }
-                except Exception:
-                    return None
-            return None
-
-        tops = []
-        try:
-            if getattr(emb_utils, "_HAS_SBER", False):
-                tops = find_nearest(client, player, top_k=3)
-        except Exception:
-            tops = []
-
-        if not tops:
-            try:
-                tops = find_nearest(client, player, top_k=3)
-            except Exception:
-                tops = []
-
-        if tops:
-            best_rid, best_sim = tops[0]
-            res = _handle_top(best_rid, best_sim)
-            if res:
-                return res
-    except Exception:
-        pass
-
     best = None
     best_score = 0
 
-    for c in candidates:
+    # Cheap prefilter: a candidate that shares no character 3-gram with
+    # the query and differs wildly in length cannot clear any alignment
+    # gate below, so it is skipped before scoring and post-processing.
+    query_grams = {player_norm[i:i + 3] for i in range(len(player_norm) - 2)}
+
+    # Bulk-score every candidate against the query in two C calls instead
+    # of two Python->C transitions per candidate. cdist needs numpy; on
+    # any failure fall back to per-candidate scoring inside the loop.
+    bulk_scores = None
+    if _HAS_RAPIDFUZZ and _rf_process is not None and prepped:
         try:
-            if time.monotonic() - started > max_secs:
-                return None
+            names_norm = [p[2].norm for p in prepped]
+            # workers=-1 runs the pairwise batch on rapidfuzz's internal
+            # thread pool with the GIL released.
+            s_sort = _rf_process.cdist(
+                [player_norm], names_norm, scorer=_token_sort_ratio, workers=-1
+            )[0]
+            s_set = _rf_process.cdist(
+                [player_norm], names_norm, scorer=_token_set_ratio, workers=-1
+            )[0]
+            bulk_scores = [int(max(a, b)) for a, b in zip(s_sort, s_set)]
         except Exception:
-            pass
-        name_raw = (c.get("player_name") or c.get("player") or "").strip()
-        if not name_raw:
-            continue
-        name_norm = normalize_name(name_raw, transliterate=transliterate)
-
-        score = 0
-        if _HAS_RAPIDFUZZ and _token_sort_ratio is not None:
-            try:
-                s1 = int(_token_sort_ratio(player_norm, name_norm) or 0)
-            except Exception:
-                try:
-                    s1 = int(
-                        _token_sort_ratio(player_norm, name_norm, score_cutoff=0) or 0
-                    )
-                except Exception:
-                    s1 = 0
-            s2 = 0
-            if _token_set_ratio is not None:
-                try:
-                    s2 = int(_token_set_ratio(player_norm, name_norm) or 0)
-                except Exception:
-                    s2 = 0
-            score = max(s1, s2)
-        else:
-            from difflib import SequenceMatcher
-            score = int(SequenceMatcher(None, player_norm, name_norm).ratio() * 100)
+            bulk_scores = None
+
+    # With bulk scores in hand, only the strongest raw matches get the
+    # expensive alignment/phonetic/reduced-name post-processing — boosts
+    # top out at 88, so candidates far down the raw ranking cannot win.
+    # Without bulk scores every candidate is walked as before.
+    if bulk_scores is not None:
+        cand_order = sorted(
+            range(len(prepped)), key=bulk_scores.__getitem__, reverse=True
+        )[:_POST_TOP_K]
+        # Candidates sharing the query surname's phonetic key can earn a
+        # boost regardless of raw token score, so their bucket (usually a
+        # handful of rows) joins the post-processing set.
+        if player_phonetic:
+            in_order = set(cand_order)
+            cand_order.extend(
+                i
+                for i in phonetic_buckets.get(player_phonetic, ())
+                if i not in in_order
+            )
+    else:
+        cand_order = range(len(prepped))
+
+    _nick = NICKNAME_MAP.get
+    for cand_idx in cand_order:
+        c, name_raw, (name_norm, cand_parts, cand_first, cand_first_canon, cand_last, cand_phonetic, cand_reduced), cand_league, cand_team = prepped[cand_idx]
+        if _now() - started > max_secs:
+            return None
 
-        # If the caller provided a league and the candidate has one,
-        # prefer same-league reports only. This prevents cross-league
-        # surname collisions (e.g., two different players named "White").
-        try:
-            cand_league = (c.get("league") or c.get("league_norm") or "").strip().lower()
-            if league_norm and cand_league and league_norm != cand_league:
+        if query_grams and abs(len(player_norm) - len(name_norm)) > 0.5 * max(
+            len(player_norm), len(name_norm)
+        ):
+            cand_grams = {name_norm[i:i + 3] for i in range(len(name_norm) - 2)}
+            if not (query_grams & cand_grams):
                 continue
-        except Exception:
-            pass
+
+        if bulk_scores is not None:
+            score = bulk_scores[cand_idx]
+        else:
+            score = max(
+                _sort_ratio(player_norm, name_norm),
+                _set_ratio(player_norm, name_norm),
+            )
 
         # If the surname matches but first names are dissimilar, avoid
         # letting token-based scores (which can be high due to identical
@@ -458,18 +595,15 @@ def _best_similar_report(
                 first_n = aln["first_n"]
                 fname_sim = aln["first_sim"]
 
-                first_p_canon = NICKNAME_MAP.get(first_p, first_p)
-                first_n_canon = NICKNAME_MAP.get(first_n, first_n)
+                first_p_canon = _nick(first_p, first_p)
+                first_n_canon = _nick(first_n, first_n)
 
                 if (
                     first_p_canon != first_n_canon
                     and fname_sim < 80
                     and not (first_p.startswith(first_n) or first_n.startswith(first_p))
                 ):
-                    try:
-                        score = min(score, int(suggest_threshold) - 1)
-                    except Exception:
-                        score = min(score, 84)
+                    score = min(score, suggest_cap)
         except Exception:
             pass
 
@@ -478,44 +612,21 @@ def _best_similar_report(
             best = {"meta": c, "name_raw": name_raw}
 
         # Extract name parts for reduced matching
-        pn_parts = player_norm.split()
-        nn_parts = name_norm.split()
+        pn_parts = player_parts
+        nn_parts = cand_parts
         
         try:
             if len(pn_parts) >= 2 and len(nn_parts) >= 2:
-                p_reduced = f"{pn_parts[0]} {pn_parts[-1]}"
-                n_reduced = f"{nn_parts[0]} {nn_parts[-1]}"
-                red_score = 0
-                if _HAS_RAPIDFUZZ and _token_sort_ratio is not None:
-                    try:
-                        red_score = int(_token_sort_ratio(p_reduced, n_reduced) or 0)
-                    except Exception:
-                        red_score = 0
-                else:
-                    from difflib import SequenceMatcher
-                    red_score = int(
-                        SequenceMatcher(None, p_reduced, n_reduced).ratio() * 100
-                    )
+                red_score = _sort_ratio(player_reduced, cand_reduced)
 
                 # Compute first-name and last-name similarity separately
                 lp = pn_parts[-1]
                 ln = nn_parts[-1]
                 first_p = pn_parts[0]
                 first_n = nn_parts[0]
-                try:
-                    if _HAS_RAPIDFUZZ and _token_set_ratio is not None:
-                        first_sim = int(_token_set_ratio(first_p, first_n) or 0)
-                        last_sim = int(_token_set_ratio(lp, ln) or 0)
-                    else:
-                        from difflib import SequenceMatcher
-                        first_sim = int(SequenceMatcher(None, first_p, first_n).ratio() * 100)
-                        last_sim = int(SequenceMatcher(None, lp, ln).ratio() * 100)
-                except Exception:
-                    first_sim = 0
-                    last_sim = 0
+                first_sim = _part_ratio(first_p, first_n)
+                last_sim = _part_ratio(lp, ln)
 
-                cand_team = (c.get("team") or "").strip().lower()
-                cand_league = (c.get("league") or c.get("league_norm") or "").strip().lower()
                 # Only consider 'have_team_or_league' true when the caller
                 # provided a team/league AND the candidate matches that
                 # team/league. This prevents promoting surname-only matches
@@ -527,8 +638,8 @@ def _best_similar_report(
                 )
 
                 strong_last = last_sim >= 85 or lp == ln
-                first_p_canon = NICKNAME_MAP.get(first_p, first_p)
-                first_n_canon = NICKNAME_MAP.get(first_n, first_n)
+                first_p_canon = player_first_canon
+                first_n_canon = cand_first_canon
                 strong_first = first_sim >= 60 or first_p == first_n or first_p_canon == first_n_canon
 
                 print(f"DEBUG FUZZY: Comparing '{player_norm}' with '{name_norm}'", file=sys.stderr)
@@ -546,17 +657,11 @@ def _best_similar_report(
                             best = {"meta": c, "name_raw": name_raw}
                     else:
                         print(f"  → CAPPING to {min(score, 84)} (not strong_first, no team/league)", file=sys.stderr)
-                        try:
-                            score = min(score, int(suggest_threshold) - 1)
-                        except Exception:
-                            score = min(score, 84)
+                        score = min(score, suggest_cap)
 
                 try:
-                    try:
-                        pk = phonetic_key(lp)
-                        nk = phonetic_key(ln)
-                    except Exception:
-                        pk = nk = None
+                    pk = player_phonetic
+                    nk = cand_phonetic
 
                     if pk and nk and pk == nk:
                         if strong_first or have_team_or_league:
@@ -565,14 +670,11 @@ def _best_similar_report(
                                 best_score = boosted
                                 best = {"meta": c, "name_raw": name_raw}
                         else:
-                            try:
-                                score = min(score, int(suggest_threshold) - 1)
-                            except Exception:
-                                score = min(score, 84)
+                            score = min(score, suggest_cap)
                     else:
-                        sk_p = re.sub(r"[aeiou]", "", lp)
-                        sk_n = re.sub(r"[aeiou]", "", ln)
-                        sk_score = int(SequenceMatcher(None, sk_p, sk_n).ratio() * 100)
+                        sk_p = lp.translate(_VOWEL_TBL)
+                        sk_n = ln.translate(_VOWEL_TBL)
+                        sk_score = _skeleton_sim(sk_p, sk_n)
                         if sk_score >= 55:
                             if strong_first or have_team_or_league:
                                 boosted = max(score, 86)
@@ -580,19 +682,13 @@ def _best_similar_report(
                                     best_score = boosted
                                     best = {"meta": c, "name_raw": name_raw}
                             else:
-                                try:
-                                    score = min(score, int(suggest_threshold) - 1)
-                                except Exception:
-                                    score = min(score, 84)
+                                score = min(score, suggest_cap)
                 except Exception:
                     pass
         except Exception:
             pass
 
-    if not best:
-        return None
-
-    if best_score >= int(auto_threshold):
+    if best and best_score >= int(auto_threshold):
         try:
             from db import get_report, get_balance
 
@@ -607,13 +703,98 @@ def _best_similar_report(
         except Exception:
             return None
 
+    # Embedding check (local-first then OpenAI fallback) — only reached
+    # when the cheap fuzzy scan could not auto-match, so the common
+    # path skips the DB connect and remote embedding call entirely.
+    try:
+        from utils.embeddings import find_nearest
+
+        def _handle_top(best_rid, best_sim):
+            if best_sim < EMBED_SUGGEST_THRESHOLD:
+                return None
+            score100 = int(best_sim * 100)
+            # One fetch shared by both branches; the old shape issued a
+            # second get_report when the auto branch fell through to
+            # suggest, and the surname gate re-normalized the same name
+            # per check.
+            payload = None
+            try:
+                from db import get_report
+
+                payload = get_report(user_id, int(best_rid))
+            except Exception:
+                payload = None
+            nn = (payload.get("player") or "") if payload else ""
+
+            if best_sim >= EMBED_AUTO_THRESHOLD and payload:
+                try:
+                    try:
+                        cand_league = ((payload.get("league") or "").strip().lower())
+                        cand_team = ((payload.get("team") or payload.get("team_name") or "").strip().lower())
+                        if league_norm and cand_league and league_norm != cand_league:
+                            return None
+                        if not league_norm and team_norm and cand_team and team_norm != cand_team:
+                            return None
+                    except Exception:
+                        pass
+                    # Apply surname-firstname safety check
+                    if not _surname_first_check(player_norm, nn, score100):
+                        return None
+
+                    payload["cached"] = True
+                    payload["report_id"] = int(best_rid)
+                    payload["matched_player_name"] = payload.get("player")
+                    payload["matched_score"] = score100
+                    from db import get_balance
+                    payload["credits_remaining"] = get_balance(user_id)
+
+                    return {
+                        "type": "auto",
+                        "payload": payload,
+                        "score": score100,
+                    }
+                except Exception:
+                    return None
+
+            # Always check first-name similarity for embedding suggestions
+            # to avoid surname-only false matches (e.g., Okaro → Derrick).
+            try:
+                if payload and not _surname_first_check(player_norm, nn, score100):
+                    return None
+            except Exception:
+                pass
+            return {
+                "type": "suggest",
+                "report_id": int(best_rid),
+                "player_name": payload.get("player") if payload else None,
+                "score": score100,
+            }
+
+        # Single lookup: find_nearest picks its backend internally, and
+        # only the best neighbor is consumed below.
+        try:
+            tops = find_nearest(client, player, top_k=1)
+        except Exception:
+            tops = []
+
+        if tops:
+            best_rid, best_sim = tops[0]
+            res = _handle_top(best_rid, best_sim)
+            if res:
+                return res
+    except Exception:
+        pass
+
+    if not best:
+        return None
+
     # Extra safety: if the best candidate's first-name similarity is
     # below the required threshold, avoid returning a suggestion so the
     # server will fall back to LLM generation. Allow suggestion only if
     # the last-name similarity is extremely high and the first-name meets
     # the secondary threshold.
     try:
-        from utils.normalize import normalize_name as _norm_name
+        _norm_name = normalize_name_cached
         aln = _compute_alignment(player_norm, _norm_name(best["name_raw"]))
         fname_sim_best = aln.get("first_sim", 0)
         last_sim_best = aln.get("last_sim", 0)
@@ -3,25 +3,47 @@
 
 import re
 
+# Section patterns, compiled once: "### <heading>" through the next "###"
+# heading (or end of string). The *_LOOSE variants tolerate trailing text
+# on the heading line for malformed markdown fallbacks.
+_SEASON_SECTION_RE = re.compile(
+    r'### Season snapshot\s*\n.*?(?=\n###|\Z)', re.DOTALL
+)
+_SEASON_SECTION_LOOSE_RE = re.compile(
+    r'### Season snapshot[^\n]*\n.*?(?=\n###|\Z)', re.DOTALL
+)
+_GAMES_SECTION_RE = re.compile(
+    r'### Last 3 games\s*\n.*?(?=\n###|\Z)', re.DOTALL
+)
+_GAMES_SECTION_LOOSE_RE = re.compile(
+    r'### Last 3 games[^\n]*\n.*?(?=\n###|\Z)', re.DOTALL
+)
+
+# Capture-group variants for extraction
+_SEASON_EXTRACT_RE = re.compile(
+    r'(### Season snapshot\s*\n.*?)(?=\n###|\Z)', re.DOTALL
+)
+_GAMES_EXTRACT_RE = re.compile(
+    r'(### Last 3 games\s*\n.*?)(?=\n###|\Z)', re.DOTALL
+)
+
 
 def extract_stats_sections(markdown: str) -> tuple[str | None, str | None]:
     """
     Extract Season snapshot and Last 3 games sections from markdown.
     Only returns the section heading and its content, nothing else.
-    
+
     Returns:
         (season_snapshot_section, last_3_games_section) or (None, None) if not found
     """
     # Match from "### Season snapshot" to the next "###" heading (non-greedy)
-    season_pattern = r'(### Season snapshot\s*\n.*?)(?=\n###|\Z)'
-    season_match = re.search(season_pattern, markdown, re.DOTALL)
+    season_match = _SEASON_EXTRACT_RE.search(markdown)
     season_section = season_match.group(1).strip() if season_match else None
-    
+
     # Match from "### Last 3 games" to the next "###" heading (non-greedy)
-    games_pattern = r'(### Last 3 games\s*\n.*?)(?=\n###|\Z)'
-    games_match = re.search(games_pattern, markdown, re.DOTALL)
+    games_match = _GAMES_EXTRACT_RE.search(markdown)
     games_section = games_match.group(1).strip() if games_match else None
-    
+
     return season_section, games_section
 
 
@@ -32,45 +54,39 @@ def replace_stats_sections(
     """
     Replace Season snapshot and Last 3 games sections in original markdown
     with fresh versions from stats-refresh LLM output.
-    
+
     Args:
         original_markdown: Full cached report
         fresh_stats_markdown: LLM output with only updated stats sections
-    
+
     Returns:
         Updated markdown with fresh stats
     """
     # Extract fresh sections
     fresh_season, fresh_games = extract_stats_sections(fresh_stats_markdown)
-    
+
     if not fresh_season or not fresh_games:
         # If extraction failed, return original unchanged
         return original_markdown
-    
+
     result = original_markdown
-    
+
     # Replace Season snapshot section
-    # Pattern: "### Season snapshot" followed by anything until the next "###" heading (or end of string)
-    season_pattern = r'### Season snapshot\s*\n.*?(?=\n###|\Z)'
     season_before = result
-    result = re.sub(season_pattern, fresh_season, result, count=1, flags=re.DOTALL)
-    
+    result = _SEASON_SECTION_RE.sub(fresh_season, result, count=1)
+
     # Verify replacement actually happened to avoid duplicates
     if result == season_before:
         # Fallback: try without the trailing content match (in case of malformed markdown)
-        season_pattern = r'### Season snapshot[^\n]*\n.*?(?=\n###|\Z)'
-        result = re.sub(season_pattern, fresh_season, result, count=1, flags=re.DOTALL)
-    
+        result = _SEASON_SECTION_LOOSE_RE.sub(fresh_season, result, count=1)
+
     # Replace Last 3 games section
-    # Pattern: "### Last 3 games" followed by anything until the next "###" heading (or end of string)
-    games_pattern = r'### Last 3 games\s*\n.*?(?=\n###|\Z)'
     games_before = result
-    result = re.sub(games_pattern, fresh_games, result, count=1, flags=re.DOTALL)
-    
+    result = _GAMES_SECTION_RE.sub(fresh_games, result, count=1)
+
     # Verify replacement actually happened to avoid duplicates
     if result == games_before:
         # Fallback: try without the trailing content match (in case of malformed markdown)
-        games_pattern = r'### Last 3 games[^\n]*\n.*?(?=\n###|\Z)'
-        result = re.sub(games_pattern, fresh_games, result, count=1, flags=re.DOTALL)
-    
+        result = _GAMES_SECTION_LOOSE_RE.sub(fresh_games, result, count=1)
+
     return result